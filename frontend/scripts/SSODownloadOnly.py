@@ -11,25 +11,29 @@ Usage:
   python script.py 2024           # override via CLI arg
 """
 
+import csv
 import json
 import logging
 import os
+import queue
 import re
 import sys
-import time
-from dataclasses import dataclass
-from typing import List, Dict
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import List, Dict, Optional
 
 import warnings
 warnings.filterwarnings("ignore")
 
-import pandas as pd
 import pdfplumber
 from pdf2image import convert_from_path
 import pytesseract
 from playwright.sync_api import sync_playwright
 import requests
 
+from sso_parallel import ordered_process_map
+
 # ===== Year configuration =====
 DEFAULT_YEAR = 2023
 YEAR = int(os.getenv("SSO_YEAR", str(DEFAULT_YEAR)))
@@ -43,7 +47,16 @@ END_DATE = f"12/31/{YEAR}"
 DOWNLOAD_DIR = f"/Users/cade/SSOs/{YEAR}"
 LINKS_JSON = f"links_{YEAR}.json"
 CSV_OUTPUT = f"/Users/cade/SSOs/sso_reports_{YEAR}.csv"
+DOWNLOAD_MANIFEST = os.path.join(DOWNLOAD_DIR, "manifest.json")  # document URL -> saved file name
 PAGE_LIMIT: int | None = None  # set to an int to stop after N pages; None means no limit
+DOWNLOAD_WORKERS = int(os.getenv("SSO_DOWNLOAD_WORKERS", "4"))  # browsers downloading in parallel
+# Pages with less extractable text than this are treated as scans and OCR'd alone.
+OCR_MIN_PAGE_CHARS = 20
+OCR_DPI = 200
+# pdftoppm processes per document for the whole-document OCR fallback.
+OCR_RASTER_THREADS = int(os.getenv("OCR_RASTER_THREADS", "2"))
+# Worker processes for PDF text extraction/OCR (CPU-bound); 1 disables the pool.
+PARSE_WORKERS = int(os.getenv("PARSE_WORKERS", str(os.cpu_count() or 1)))
 
 pytesseract.pytesseract.tesseract_cmd = "/usr/bin/tesseract"
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
@@ -54,13 +67,35 @@ def ensure_dirs() -> None:
     os.makedirs(DOWNLOAD_DIR, exist_ok=True)
 
 
-@dataclass
+@dataclass(slots=True)
 class DocLink:
     url: str
     file_name: str
     metadata: Dict[str, str]
 
 
+# Result-grid rows (after the two header rows) as {href, cells}: href is null
+# when the first cell has no link (or the link has no href); cells holds the
+# innerText of the first seven cells.
+_GRID_ROWS_JS = """
+() => Array.from(
+    document.querySelectorAll("table#ctl00_ContentPlaceHolder1_DocsGridView tbody tr")
+).slice(2).map((tr) => {
+    const cells = Array.from(tr.querySelectorAll("td"));
+    const link = cells.length ? cells[0].querySelector("a") : null;
+    return {
+        href: link ? link.getAttribute("href") : null,
+        cells: cells.slice(0, 7).map((td) => td.innerText),
+    };
+})
+"""
+
+
+def _is_postback(response) -> bool:
+    """Match the form POST that ASP.NET sends for a (full or partial) postback."""
+    return response.request.method == "POST"
+
+
 def scrape_links() -> List[DocLink]:
     """Use Playwright to collect PDF links for YEAR SSO reports."""
     logging.info("Scraping document links from eFile for YEAR=%s (%s–%s)", YEAR, START_DATE, END_DATE)
@@ -90,25 +125,30 @@ def scrape_links() -> List[DocLink]:
             el.removeAttribute('readonly');
             el.value = '{END_DATE}';
         """)
-        time.sleep(1)
 
-        # Custom Query
+        # Custom Query. Instead of fixed sleeps, each step waits for a
+        # condition that only holds once its postback has happened (an idle
+        # check alone can pass before the postback starts); Playwright's
+        # actions already wait for their target to be visible and enabled.
         page.evaluate("""
             document.getElementById("ctl00_ContentPlaceHolder1_CheckBoxCustomQuery").click();
         """)
-        time.sleep(2)
+        page.wait_for_function(
+            """() => {
+                const types = document.getElementById("ctl00_ContentPlaceHolder1_ListBoxTypes");
+                return types !== null && !types.disabled;
+            }"""
+        )
 
         # Select "SSO" type and "Water" media
         page.select_option("#ctl00_ContentPlaceHolder1_ListBoxTypes", value="SSO")
-        time.sleep(0.5)
         page.check("#ctl00_ContentPlaceHolder1_LibraryCheckBoxList_2")
-        time.sleep(0.5)
 
         # Add Type and Search
-        page.click("#ctl00_ContentPlaceHolder1_ButtonAddType")
-        time.sleep(1)
+        with page.expect_response(_is_postback):
+            page.click("#ctl00_ContentPlaceHolder1_ButtonAddType")
+        page.wait_for_load_state("networkidle")
         page.click("#ctl00_ContentPlaceHolder1_SearchButton")
-        time.sleep(5)
         page.wait_for_selector("table#ctl00_ContentPlaceHolder1_DocsGridView")
 
         page_num = 1
@@ -116,29 +156,27 @@ def scrape_links() -> List[DocLink]:
 
         while True:
             logging.info("Reading result page %s", page_num)
-            rows = page.query_selector_all("table#ctl00_ContentPlaceHolder1_DocsGridView tbody tr")[2:]
+            # One evaluate per result page returns every row's link and cell
+            # text, instead of a browser round-trip per row, cell and attribute.
+            rows = page.evaluate(_GRID_ROWS_JS)
             if not rows:
                 break
             for row in rows:
-                cells = row.query_selector_all("td")
+                cells = row["cells"]
                 if len(cells) < 2:
                     continue
 
-                link_el = cells[0].query_selector("a")
-                if not link_el:
-                    continue
-
-                raw_href = link_el.get_attribute("href")
+                raw_href = row["href"]
                 if (raw_href is None) or raw_href.lower().startswith("javascript:"):
                     continue
 
                 metadata = {
-                    "master_id": cells[1].inner_text().strip() if len(cells) > 1 else "",
-                    "facility": cells[2].inner_text().strip() if len(cells) > 2 else "",
-                    "permit": cells[3].inner_text().strip() if len(cells) > 3 else "",
-                    "county": cells[4].inner_text().strip() if len(cells) > 4 else "",
-                    "date": cells[5].inner_text().strip() if len(cells) > 5 else "",
-                    "type": cells[6].inner_text().strip() if len(cells) > 6 else "",
+                    "master_id": cells[1].strip() if len(cells) > 1 else "",
+                    "facility": cells[2].strip() if len(cells) > 2 else "",
+                    "permit": cells[3].strip() if len(cells) > 3 else "",
+                    "county": cells[4].strip() if len(cells) > 4 else "",
+                    "date": cells[5].strip() if len(cells) > 5 else "",
+                    "type": cells[6].strip() if len(cells) > 6 else "",
                 }
                 facility_raw = metadata.get('facility', 'unknown')
                 date_raw = metadata.get('date', 'unknown')
@@ -155,14 +193,13 @@ def scrape_links() -> List[DocLink]:
                     file_name = f"{base_file_name}_{count}.pdf"
                 filename_counters[key] = count + 1
 
-                href = link_el.get_attribute("href") or ""
+                href = raw_href
                 if href and not href.lower().startswith("http"):
                     href = "https://app.adem.alabama.gov/eFile/" + href.lstrip("/")
                 links.append(DocLink(href, file_name, metadata))
 
             # pagination
             page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            time.sleep(0.5)
             next_page_num = page_num + 1
 
             num_link = page.query_selector(f"a[href*='Page${next_page_num}']") or \
@@ -170,7 +207,11 @@ def scrape_links() -> List[DocLink]:
                        page.query_selector("a:has-text('Next >')")
 
             if num_link and num_link.is_enabled():
-                num_link.click(force=True)
+                # The old grid still matches the row selector, so wait for the
+                # page-change postback's response and the page to settle first.
+                with page.expect_response(_is_postback):
+                    num_link.click(force=True)
+                page.wait_for_load_state("networkidle")
                 page.wait_for_selector("table#ctl00_ContentPlaceHolder1_DocsGridView tbody tr:nth-child(3)", timeout=30000)
                 page_num += 1
                 if PAGE_LIMIT and page_num > PAGE_LIMIT:
@@ -185,53 +226,130 @@ def scrape_links() -> List[DocLink]:
         browser.close()
 
     with open(LINKS_JSON, "w") as fh:
-        json.dump([l.__dict__ for l in links], fh, indent=2)
+        json.dump([asdict(l) for l in links], fh, indent=2)
     logging.info("Found %d documents", len(links))
     return links
 
 
-def download_pdfs(links: List[DocLink], limit: int = None) -> None:
-    """Download each PDF to ``DOWNLOAD_DIR`` using Playwright."""
+def _download_worker(
+    jobs: "queue.Queue[DocLink]",
+    budget: Dict[str, int | None],
+    manifest: Dict[str, str],
+    lock: threading.Lock,
+) -> None:
+    """Drain ``jobs`` with this thread's own browser until the queue or the budget runs out."""
+    # The sync Playwright API is bound to the thread that starts it, so every
+    # worker drives a separate browser instead of sharing one page.
     with sync_playwright() as pw:
         DEV_MODE = "--show" in sys.argv
         browser = pw.chromium.launch(headless=not DEV_MODE, slow_mo=250 if DEV_MODE else 0)
         context = browser.new_context(accept_downloads=True)
         page = context.new_page()
-        count = 0
-        for link in links:
-            if limit is not None and count >= limit:
+        while True:
+            # Reserve a slot of the download limit before taking a link; a
+            # failed download hands its slot back.
+            with lock:
+                if budget["remaining"] is not None:
+                    if budget["remaining"] <= 0:
+                        break
+                    budget["remaining"] -= 1
+            try:
+                link = jobs.get_nowait()
+            except queue.Empty:
                 break
-            if link.url.lower().startswith("javascript:"):
-                continue
             dest = os.path.join(DOWNLOAD_DIR, link.file_name)
-            if os.path.exists(dest):
-                continue
             logging.info("Downloading %s", dest)
+            # Save beside the target and rename, so an interrupted download
+            # never leaves a partial PDF that later runs would skip.
+            partial = dest + ".part"
             try:
                 page.goto(link.url, timeout=60000)
                 page.wait_for_selector("#STR_DOWNLOAD", timeout=30000, state="visible")
                 with page.expect_download() as download_info:
                     page.click("#STR_DOWNLOAD")
                 download = download_info.value
-                download.save_as(dest)
-                count += 1
-                time.sleep(0.5)
+                download.save_as(partial)
+                os.replace(partial, dest)
+                with lock:
+                    manifest[link.url] = link.file_name
             except Exception as e:
                 logging.warning("Failed to download %s: %s", link.url, e)
+                if os.path.exists(partial):
+                    os.remove(partial)
+                with lock:
+                    if budget["remaining"] is not None:
+                        budget["remaining"] += 1
         context.close()
         browser.close()
 
 
-def parse_pdf_text(text: str) -> Dict[str, str]:
-    """Extract key fields from raw text."""
-    regex = {
+def _load_manifest() -> Optional[Dict[str, str]]:
+    """Return the saved manifest, ``{}`` if there is none, or None if it is unreadable."""
+    try:
+        with open(DOWNLOAD_MANIFEST) as fh:
+            manifest = json.load(fh)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logging.warning("Could not read %s: %s", DOWNLOAD_MANIFEST, e)
+        return None
+    if not isinstance(manifest, dict):
+        logging.warning("Ignoring %s: expected a JSON object", DOWNLOAD_MANIFEST)
+        return None
+    return manifest
+
+
+def download_pdfs(links: List[DocLink], limit: int = None) -> None:
+    """Download each PDF to ``DOWNLOAD_DIR`` using ``DOWNLOAD_WORKERS`` Playwright browsers.
+
+    Links already recorded in ``DOWNLOAD_MANIFEST`` (URL -> file name) whose
+    file is still on disk are skipped, even if this scrape named them anew.
+    A manifest that cannot be read is left untouched for manual repair.
+    """
+    saved = _load_manifest()
+    manifest = saved if saved is not None else {}
+    jobs: "queue.Queue[DocLink]" = queue.Queue()
+    for link in links:
+        if link.url.lower().startswith("javascript:"):
+            continue
+        if os.path.exists(os.path.join(DOWNLOAD_DIR, link.file_name)):
+            continue
+        known = manifest.get(link.url)
+        if known and os.path.exists(os.path.join(DOWNLOAD_DIR, known)):
+            continue
+        jobs.put(link)
+    if jobs.empty():
+        return
+
+    budget: Dict[str, int | None] = {"remaining": limit}
+    lock = threading.Lock()
+    workers = max(1, min(DOWNLOAD_WORKERS, jobs.qsize()))
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_download_worker, jobs, budget, manifest, lock) for _ in range(workers)]
+            for future in futures:
+                future.result()
+    finally:
+        # Written even when a worker dies, so finished downloads are remembered;
+        # never over a manifest we failed to parse, which would drop its history.
+        if saved is not None:
+            with open(DOWNLOAD_MANIFEST, "w") as fh:
+                json.dump(manifest, fh, indent=2)
+        else:
+            logging.warning("Not updating unreadable %s", DOWNLOAD_MANIFEST)
+
+
+# Field patterns for parse_pdf_text, compiled once at import instead of being
+# looked up in re's cache for every field of every PDF.
+_FIELD_PATTERNS = {
+    key: re.compile(pat, re.IGNORECASE | re.DOTALL)
+    for key, pat in {
         "permit_number": r"Permit Number\s+([A-Z0-9]+)",
         "permittee": r"Permittee\s+([A-Za-z0-9 ,.&\-]+)",
         "facility_name": r"Facility Name\s+(.+?)\s+Facility County",
         "facility_county": r"Facility County\s+(\w+)",
         "sso_id": r"Assigned SSO ID\s+SSO-(\d+)",
         "volume": r"Estimated Volume Discharged \(in gallons\)\s+([\d,<> to]+)",
-        "volume_range": r"Estimated Volume Discharged \(Range\)\s*[\d,<=> ]*gallons\s*<=\s*([\d,]+)",
         "source": r"Indicate source of discharge event\s+(.+?)\s+County in which",
         "latitude": r"Latitude/Longitude of discharge\s+([\d\.\-]+),",
         "longitude": r"Latitude/Longitude of discharge\s+[\d\.\-]+,\s*([\d\.\-]+)",
@@ -247,11 +365,34 @@ def parse_pdf_text(text: str) -> Dict[str, str]:
         "public_notice": r"Indicate efforts to notify public.*?\n(.+?)\nDate signs were placed:",
         "signs_date": r"Date signs were placed:\s+([\d/]+)",
         "health_notified": r"County Health Department notification date:\s+([\d/]+)",
-    }
+    }.items()
+}
+_VOLUME_RANGE_RE = re.compile(
+    r"Estimated Volume Discharged \(Range\)\s*[\d,<=> ]*gallons\s*<=\s*([\d,]+)",
+    re.IGNORECASE | re.DOTALL,
+)
+_SSO_SECTION_RE = re.compile(r"SSO Event - Information\s*(.*?)\n\n", re.IGNORECASE | re.DOTALL)
+_START_RE = re.compile(
+    r"Date/Time SSO Event Started:\s*Date Time\s*([\d/]+)\s*([\d:]+\s*[apmAPM]{2})", re.IGNORECASE
+)
+_STOP_RE = re.compile(
+    r"Date/Time SSO Event Stopped:\s*Date Time\s*([\d/]+)\s*([\d:]+\s*[apmAPM]{2})", re.IGNORECASE
+)
+_ADDRESS_BLOCK_RE = re.compile(
+    r"Street Address\s*\n*\s*(.+?)\s*\n*\s*City\s*\n*\s*(.+?),\s*\n*\s*State\s*\n*\s*([A-Z]{2})\s*\n*\s*ZIP Code\s*\n*\s*(\d+)\s*\n*\s*Location Description\s*\n*\s*(.+?)\s*\n*\s*Known or suspected cause",
+    re.IGNORECASE | re.DOTALL,
+)
+_ADDRESS_RE = re.compile(r"Street Address\s+(.+?)\s+City", re.IGNORECASE | re.DOTALL)
+_CITY_RE = re.compile(r"City\s+(.+?),", re.IGNORECASE)
+_ZIP_RE = re.compile(r"ZIP Code\s+(\d+)", re.IGNORECASE)
+
+
+def parse_pdf_text(text: str) -> Dict[str, str]:
+    """Extract key fields from raw text."""
     data = {}
-    for key, pat in regex.items():
+    for key, pattern in _FIELD_PATTERNS.items():
         if key == "volume":
-            m = re.search(regex["volume"], text, flags=re.IGNORECASE | re.DOTALL)
+            m = pattern.search(text)
             if m:
                 vol_str = m.group(1).strip()
                 if '<' in vol_str or 'to' in vol_str.lower():
@@ -259,44 +400,33 @@ def parse_pdf_text(text: str) -> Dict[str, str]:
                 else:
                     data["volume"] = vol_str
             else:
-                m = re.search(regex["volume_range"], text, flags=re.IGNORECASE | re.DOTALL)
+                m = _VOLUME_RANGE_RE.search(text)
                 if m:
                     data["volume"] = m.group(1).strip()
                 else:
                     data["volume"] = "9999"
-        elif key == "volume_range":
-            continue
         else:
-            m = re.search(pat, text, flags=re.IGNORECASE | re.DOTALL)
+            m = pattern.search(text)
             data[key] = m.group(1).strip() if m else None
 
     # SSO Event section
-    sso_info_match = re.search(r"SSO Event - Information\s*(.*?)\n\n", text, flags=re.IGNORECASE | re.DOTALL)
+    sso_info_match = _SSO_SECTION_RE.search(text)
     sso_section = sso_info_match.group(1) if sso_info_match else text
 
-    start_match = re.search(
-        r"Date/Time SSO Event Started:\s*Date Time\s*([\d/]+)\s*([\d:]+\s*[apmAPM]{2})",
-        sso_section, flags=re.IGNORECASE,
-    )
+    start_match = _START_RE.search(sso_section)
     if start_match:
         data["start"] = f"{start_match.group(1)} {start_match.group(2)}"
     else:
         data["start"] = None
 
-    stop_match = re.search(
-        r"Date/Time SSO Event Stopped:\s*Date Time\s*([\d/]+)\s*([\d:]+\s*[apmAPM]{2})",
-        sso_section, flags=re.IGNORECASE,
-    )
+    stop_match = _STOP_RE.search(sso_section)
     if stop_match:
         data["stop"] = f"{stop_match.group(1)} {stop_match.group(2)}"
     else:
         data["stop"] = None
 
     # Address block fallback logic remains as in your original
-    address_block_match = re.search(
-        r"Street Address\s*\n*\s*(.+?)\s*\n*\s*City\s*\n*\s*(.+?),\s*\n*\s*State\s*\n*\s*([A-Z]{2})\s*\n*\s*ZIP Code\s*\n*\s*(\d+)\s*\n*\s*Location Description\s*\n*\s*(.+?)\s*\n*\s*Known or suspected cause",
-        text, flags=re.IGNORECASE | re.DOTALL,
-    )
+    address_block_match = _ADDRESS_BLOCK_RE.search(text)
     if address_block_match:
         data["address"] = address_block_match.group(1).strip()
         data["city"] = address_block_match.group(2).strip()
@@ -305,25 +435,89 @@ def parse_pdf_text(text: str) -> Dict[str, str]:
         data["location_desc"] = address_block_match.group(5).strip()
     else:
         if not data.get("address"):
-            addr_m = re.search(r"Street Address\s+(.+?)\s+City", text, flags=re.IGNORECASE | re.DOTALL)
+            addr_m = _ADDRESS_RE.search(text)
             if addr_m:
                 data["address"] = addr_m.group(1).strip()
         if not data.get("city"):
-            city_m = re.search(r"City\s+(.+?),", text, flags=re.IGNORECASE)
+            city_m = _CITY_RE.search(text)
             if city_m:
                 data["city"] = city_m.group(1).strip()
         if not data.get("zip"):
-            zip_m = re.search(r"ZIP Code\s+(\d+)", text, flags=re.IGNORECASE)
+            zip_m = _ZIP_RE.search(text)
             if zip_m:
                 data["zip"] = zip_m.group(1).strip()
         if not data.get("location_desc"):
-            loc_m = re.search(r"Location Description\s+(.+?)\s+Known or suspected cause", text, flags=re.IGNORECASE | re.DOTALL)
+            loc_m = _FIELD_PATTERNS["location_desc"].search(text)
             if loc_m:
                 data["location_desc"] = loc_m.group(1).strip()
 
     return data
 
 
+def _ocr_page(path: str, page_number: int) -> str:
+    """OCR a single (scanned) page rather than rasterizing the whole document."""
+    try:
+        images = convert_from_path(
+            path, dpi=OCR_DPI, grayscale=True, first_page=page_number, last_page=page_number
+        )
+    except Exception as e:
+        logging.warning("OCR failed on page %s of %s: %s", page_number, os.path.basename(path), e)
+        return ""
+    return "".join(pytesseract.image_to_string(img) for img in images)
+
+
+def _parse_one(path: str) -> Optional[Dict[str, str]]:
+    """Extract and parse one PDF; returns None when it has no pages or OCR fails."""
+    pdf_name = os.path.basename(path)
+    # Page texts are collected and joined once rather than concatenated.
+    chunks: List[str] = []
+    text: Optional[str] = None
+    try:
+        with pdfplumber.open(path) as pdf:
+            if not pdf.pages:
+                return None
+            for page_number, page in enumerate(pdf.pages, start=1):
+                try:
+                    page_text = page.extract_text(layout=True) or ""
+                except Exception as e:
+                    logging.warning("Text extraction error in %s: %s", pdf_name, e)
+                    continue
+                if len(page_text.strip()) < OCR_MIN_PAGE_CHARS:
+                    page_text = _ocr_page(path, page_number) or page_text
+                chunks.append(page_text)
+    except Exception:
+        try:
+            # Grayscale is what Tesseract binarizes from anyway and is a third
+            # of the RGB raster; pages rasterize in parallel.
+            images = convert_from_path(
+                path, dpi=OCR_DPI, grayscale=True, thread_count=OCR_RASTER_THREADS
+            )
+            if images:
+                page_texts = [pytesseract.image_to_string(img) for img in images]
+                text = "\n".join(page_texts)
+        except Exception as ex:
+            logging.warning("OCR failed on %s: %s", pdf_name, ex)
+            return None
+    if text is None:
+        text = "".join(chunks)
+
+    record = parse_pdf_text(text)
+    record["file_name"] = pdf_name
+    return record
+
+
+def _append_csv(records: List[Dict[str, str]]) -> None:
+    """Append parsed records to ``CSV_OUTPUT``, writing the header for a new file."""
+    write_header = not os.path.exists(CSV_OUTPUT)
+    # Plain csv writer in the layout DataFrame.to_csv produced: record key
+    # order, empty cells for None, "\n" line endings.
+    with open(CSV_OUTPUT, "a", newline="", encoding="utf-8") as fh:
+        writer = csv.DictWriter(fh, fieldnames=list(records[0]), lineterminator="\n")
+        if write_header:
+            writer.writeheader()
+        writer.writerows(records)
+
+
 def parse_pdfs(input_dir: str = DOWNLOAD_DIR) -> None:
     """Parse each downloaded PDF and write a CSV."""
     records = []
@@ -331,50 +525,31 @@ def parse_pdfs(input_dir: str = DOWNLOAD_DIR) -> None:
 
     if os.path.exists(CSV_OUTPUT):
         try:
-            existing_df = pd.read_csv(CSV_OUTPUT)
-            processed_files = set(existing_df['file_name'].dropna().unique())
+            with open(CSV_OUTPUT, newline="", encoding="utf-8") as fh:
+                processed_files = {row["file_name"] for row in csv.DictReader(fh) if row.get("file_name")}
         except Exception:
             pass
 
-    pdf_files = sorted(f for f in os.listdir(input_dir) if f.lower().endswith(".pdf") and not f.startswith("."))
-
-    for pdf_name in pdf_files:
-        if pdf_name in processed_files:
-            continue
-
-        path = os.path.join(input_dir, pdf_name)
-        text = ""
-        try:
-            with pdfplumber.open(path) as pdf:
-                if not pdf.pages:
-                    continue
-                for page in pdf.pages:
-                    try:
-                        text += page.extract_text(layout=True) or ""
-                    except Exception as e:
-                        logging.warning("Text extraction error in %s: %s", pdf_name, e)
-        except Exception:
-            try:
-                images = convert_from_path(path)
-                if images:
-                    page_texts = [pytesseract.image_to_string(img) for img in images]
-                    text = "\n".join(page_texts)
-            except Exception as ex:
-                logging.warning("OCR failed on %s: %s", pdf_name, ex)
+    pdf_paths = [
+        os.path.join(input_dir, f)
+        for f in sorted(os.listdir(input_dir))
+        if f.lower().endswith(".pdf") and not f.startswith(".") and f not in processed_files
+    ]
+
+    # Each PDF is independent, so extraction and OCR run across processes;
+    # map() keeps file order for the incremental CSV appends below.
+    with ordered_process_map(_parse_one, pdf_paths, PARSE_WORKERS) as results:
+        for record in results:
+            if record is None:
                 continue
+            records.append(record)
 
-        record = parse_pdf_text(text)
-        record["file_name"] = pdf_name
-        records.append(record)
-
-        if len(records) % 10 == 0:
-            df_partial = pd.DataFrame(records)
-            df_partial.to_csv(CSV_OUTPUT, mode='a', header=not os.path.exists(CSV_OUTPUT), index=False)
-            records.clear()
+            if len(records) % 10 == 0:
+                _append_csv(records)
+                records.clear()
 
     if records:
-        df = pd.DataFrame(records)
-        df.to_csv(CSV_OUTPUT, mode='a', header=not os.path.exists(CSV_OUTPUT), index=False)
+        _append_csv(records)
 
     logging.info("CSV written to %s", CSV_OUTPUT)
 
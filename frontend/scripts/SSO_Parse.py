@@ -16,12 +16,15 @@ Usage:
 import os
 import sys
 import csv
+import functools
 import re
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional
 
 import pdfplumber
 
+from sso_parallel import ordered_process_map
+
 # -------- Config (env or CLI) --------
 PDF_DIR = os.getenv("PDF_DIR", "/Users/cade/SSOs")
 OUTPUT_CSV = os.getenv("OUTPUT_CSV", "parsed_sso_data.csv")
@@ -29,6 +32,8 @@ if len(sys.argv) >= 2:
     PDF_DIR = sys.argv[1]
 if len(sys.argv) >= 3:
     OUTPUT_CSV = sys.argv[2]
+# Worker processes for PDF extraction (pdfplumber is CPU-bound); 1 disables the pool.
+PARSE_WORKERS = int(os.getenv("PARSE_WORKERS", str(os.cpu_count() or 1)))
 
 # Toggle if you ever want the raw name preserved in a new column.
 PRESERVE_RAW_WATERNAME = False  # set True to add 'receiving_water_raw' column
@@ -70,33 +75,83 @@ if PRESERVE_RAW_WATERNAME:
 # -------- Helpers --------
 
 _LABEL_RE = re.compile(r"[A-Za-z].*?:?$")  # crude “looks like a label” detector
+_PERMITTEE_INLINE_RE = re.compile(r"^Permittee\s+(.{3,})$", re.I)
+_SSO_ID_RE = re.compile(r"(?:Assigned\s+)?SSO\s*ID\s*(SSO-\d+)", re.I)
+_VOL_RANGE_RE = re.compile(r"(\d[\d,]*)\s*<\s*gallons\s*<=\s*(\d[\d,]*)", re.I)
+_VOL_NUM_RE = re.compile(r"(\d[\d,]*)")
+_VOL_STANDALONE_RE = re.compile(r"^(\d[\d,]*)$")
+_VOL_RANGE_LABEL_RE = re.compile(r"Estimated Volume Discharged[^\n]{0,80}?Range", re.I)
+_LATLON_RE = re.compile(r"Latitude/Longitude of discharge\s*([-\d\.]+)[,\s]+([-\d\.]+)", re.I)
+_PLACEHOLDER_RE = re.compile(r"(creek|river|drainage ditch|storm drain|provide.*)", re.I)
+_ALPHA_RE = re.compile(r"[A-Za-z]")
+_FOOTER_TS_RE = re.compile(r"(\d{1,2}/\d{1,2}/\d{4})\s+(\d{1,2}:\d{2}:\d{2})\s*(AM|PM)", re.I)
+# Components are captured separately so matches become datetimes without strptime.
+_DATE_PAT = r"(\d{1,2})/(\d{1,2})/(\d{4})"
+# The gap before the meridiem is captured too: strptime's "%M %p" needs at
+# least one whitespace there, so "10:30PM" must still be rejected.
+_TIME_PAT = r"(\d{1,2}):(\d{2})(\s*)(AM|PM|am|pm)"
 
 def _clean(s: Optional[str]) -> str:
     return (s or "").strip()
 
-def extract_after(lines: List[str], label: str, default: str = "") -> str:
-    label_l = label.lower()
-    placeholders = {
-        "creek or river",
-        "drainage ditch",
-        "storm drain",
-        "provide",
-        "n/a",
-        "na",
-    }
+_PLACEHOLDERS = (
+    "creek or river",
+    "drainage ditch",
+    "storm drain",
+    "provide",
+    "n/a",
+    "na",
+)
+
+RECEIVING_WATER_PROMPT = "provide the first named creek or river that receives the flow"
+
+# Labels process_pdf looks up; located in one pass per PDF by index_labels.
+FIELD_LABELS = (
+    "destination of discharge",
+    "facility name",
+    "did the discharge reach a designated swimming water",
+    "monitoring of the receiving water",
+    "was the affected area cleaned",
+    "was the affected area disinfected",
+    "known or suspected cause of the discharge",
+    RECEIVING_WATER_PROMPT,
+)
+
+def index_labels(lines: List[str], labels: Tuple[str, ...] = FIELD_LABELS) -> Dict[str, int]:
+    """Map each lowercase label to the first line index containing it."""
+    index: Dict[str, int] = {}
     for i, ln in enumerate(lines):
-        if label_l in ln.lower():
-            for nxt in lines[i + 1 : i + 10]:
-                nxt = _clean(nxt)
-                if not nxt:
-                    continue
-                if nxt.endswith(":") or _LABEL_RE.fullmatch(nxt):
-                    break
-                low = nxt.lower()
-                if any(ph in low for ph in placeholders):
-                    continue
-                return nxt
+        low = ln.lower()
+        for lbl in labels:
+            if lbl not in index and lbl in low:
+                index[lbl] = i
+        if len(index) == len(labels):
+            break
+    return index
+
+def extract_after(
+    lines: List[str],
+    label: str,
+    default: str = "",
+    index: Optional[Dict[str, int]] = None,
+) -> str:
+    label_l = label.lower()
+    if index is not None and label_l in FIELD_LABELS:
+        start = index.get(label_l)
+    else:
+        start = next((i for i, ln in enumerate(lines) if label_l in ln.lower()), None)
+    if start is None:
+        return default
+    for nxt in lines[start + 1 : start + 10]:
+        nxt = _clean(nxt)
+        if not nxt:
+            continue
+        if nxt.endswith(":") or _LABEL_RE.fullmatch(nxt):
             break
+        low = nxt.lower()
+        if any(ph in low for ph in _PLACEHOLDERS):
+            continue
+        return nxt
     return default
 
 def get_permittee(lines: List[str]) -> str:
@@ -107,87 +162,102 @@ def get_permittee(lines: List[str]) -> str:
                 if nxt and "permit number" not in nxt.lower():
                     return nxt
     for ln in lines:
-        m = re.search(r"^Permittee\s+(.{3,})$", ln, flags=re.I)
+        m = _PERMITTEE_INLINE_RE.search(ln)
         if m:
             return _clean(m.group(1))
     return ""
 
+@functools.lru_cache(maxsize=16)
+def _label_datetime_re(label: str) -> re.Pattern:
+    return re.compile(
+        rf"{re.escape(label)}[\s\S]{{0,250}}?{_DATE_PAT}[^\d]{{0,40}}?{_TIME_PAT}", re.I
+    )
+
 def extract_datetime_from_text(text: str, label_variants: Tuple[str, ...]) -> str:
-    date_pat = r"(\d{1,2}/\d{1,2}/\d{4})"
-    time_pat = r"(\d{1,2}:\d{2}\s*(?:AM|PM|am|pm))"
+    lowered = text.lower()
     for lbl in label_variants:
-        patt = rf"{re.escape(lbl)}[\s\S]{{0,250}}?{date_pat}[^\d]{{0,40}}?{time_pat}"
-        m = re.search(patt, text, re.I)
+        # Cheap substring gate: most PDFs use only one of the label spellings,
+        # so skip the date/time regex for variants that cannot match.
+        if lbl.lower() not in lowered:
+            continue
+        m = _label_datetime_re(lbl).search(text)
         if m:
+            month, day, year, hour, minute = (int(g) for g in m.group(1, 2, 3, 4, 5))
+            if not 1 <= hour <= 12 or not m.group(6):  # what strptime rejects
+                continue
+            hour %= 12
+            if m.group(7).lower() == "pm":
+                hour += 12
             try:
-                return datetime.strptime(
-                    f"{m.group(1)} {m.group(2)}", "%m/%d/%Y %I:%M %p"
-                ).isoformat()
+                return datetime(year, month, day, hour, minute).isoformat()
             except ValueError:
                 continue
     return ""
 
 def extract_sso_id(text: str) -> str:
-    m = re.search(r"(?:Assigned\s+)?SSO\s*ID\s*(SSO-\d+)", text, re.I)
+    m = _SSO_ID_RE.search(text)
     return m.group(1) if m else ""
 
 def extract_volume(text: str, lines: List[str]) -> str:
-    m = re.search(r"(\d[\d,]*)\s*<\s*gallons\s*<=\s*(\d[\d,]*)", text, re.I)
+    m = _VOL_RANGE_RE.search(text)
     if m:
         return m.group(2).replace(",", "")
     for idx, ln in enumerate(lines):
         if "estimated volume discharged" in ln.lower():
-            m_same = re.search(r"(\d[\d,]*)", ln)
+            m_same = _VOL_NUM_RE.search(ln)
             if m_same:
                 return m_same.group(1).replace(",", "")
             lookahead = (l.strip() for l in lines[idx + 1 : idx + 8] if l.strip())
             for follow in lookahead:
                 if len(follow) > 25:
                     continue
-                m_num = re.match(r"^(\d[\d,]*)$", follow)
+                m_num = _VOL_STANDALONE_RE.match(follow)
                 if m_num:
                     return m_num.group(1).replace(",", "")
             break
-    if re.search(r"Estimated Volume Discharged[^\n]{0,80}?Range", text, re.I):
+    if _VOL_RANGE_LABEL_RE.search(text):
         return "9999"
     return ""
 
 def extract_lat_lon(text: str) -> Tuple[str, str]:
-    patt = r"Latitude/Longitude of discharge\s*([-\d\.]+)[,\s]+([-\d\.]+)"
-    m = re.search(patt, text, re.I)
+    m = _LATLON_RE.search(text)
     if m:
         return m.group(1), m.group(2)
     return "", ""
 
-def extract_receiving_water(text: str, destination: Optional[str] = None) -> str:
+def extract_receiving_water(
+    text: str,
+    destination: Optional[str] = None,
+    lines: Optional[List[str]] = None,
+    index: Optional[Dict[str, int]] = None,
+) -> str:
     if destination and "ground absorbed" in destination.lower():
         return "Ground absorbed"
-    lines = [ln.strip() for ln in text.splitlines()]
-    helper_re = re.compile(
-        r"provide the first named creek or river that receives the flow", re.I
-    )
-    for idx, ln in enumerate(lines):
-        if helper_re.search(ln):
-            for nxt in lines[idx + 1 : idx + 10]:
-                nxt = _clean(nxt)
-                if not nxt:
-                    continue
-                if re.fullmatch(r"(creek|river|drainage ditch|storm drain|provide.*)", nxt, re.I):
-                    continue
-                if re.search(r"[A-Za-z]", nxt):
-                    return nxt
-            break
+    if lines is None:
+        lines = [ln.strip() for ln in text.splitlines()]
+    if index is not None:
+        start = index.get(RECEIVING_WATER_PROMPT)
+    else:
+        start = next((i for i, ln in enumerate(lines) if RECEIVING_WATER_PROMPT in ln.lower()), None)
+    if start is None:
+        return destination or ""
+    for nxt in lines[start + 1 : start + 10]:
+        nxt = _clean(nxt)
+        if not nxt:
+            continue
+        if _PLACEHOLDER_RE.fullmatch(nxt):
+            continue
+        if _ALPHA_RE.search(nxt):
+            return nxt
     return destination or ""
 
 def extract_submission_ts(text: str) -> Optional[datetime]:
-    matches = re.findall(
-        r"(\d{1,2}/\d{1,2}/\d{4})\s+(\d{1,2}:\d{2}:\d{2})\s*(AM|PM)",
-        text,
-        re.I,
-    )
-    if not matches:
+    last = None
+    for last in _FOOTER_TS_RE.finditer(text):
+        pass
+    if last is None:
         return None
-    d, t, ampm = matches[-1]
+    d, t, ampm = last.group(1, 2, 3)
     try:
         return datetime.strptime(f"{d} {t} {ampm}", "%m/%d/%Y %H:%M:%S %p")
     except ValueError:
@@ -201,7 +271,8 @@ def read_pdf_text(file_path: str) -> Tuple[str, List[str]]:
 
 def process_pdf(file_path: str) -> Dict[str, object]:
     text, lines = read_pdf_text(file_path)
-    dest = extract_after(lines, "Destination of discharge")
+    labels = index_labels(lines)
+    dest = extract_after(lines, "Destination of discharge", index=labels)
     start = extract_datetime_from_text(
         text,
         ("Date/Time SSO Event Started", "Date / Time SSO Event Started", "Date - Time SSO Event Started"),
@@ -214,23 +285,30 @@ def process_pdf(file_path: str) -> Dict[str, object]:
     return {
         "sso_id": extract_sso_id(text),
         "permittee": get_permittee(lines),
-        "facility": extract_after(lines, "Facility Name"),
+        "facility": extract_after(lines, "Facility Name", index=labels),
         "start": start,
         "stop": stop,
         "volume": extract_volume(text, lines),
-        "receiving_water": extract_receiving_water(text, dest),
+        "receiving_water": extract_receiving_water(text, dest, lines, labels),
         "latitude": lat,
         "longitude": lon,
         "destination": dest,
-        "swimming_water": extract_after(lines, "Did the discharge reach a designated swimming water"),
-        "monitoring": extract_after(lines, "Monitoring of the receiving water"),
-        "cleaned": extract_after(lines, "Was the affected area cleaned"),
-        "disinfected": extract_after(lines, "Was the affected area disinfected"),
-        "cause": extract_after(lines, "Known or suspected cause of the discharge"),
+        "swimming_water": extract_after(lines, "Did the discharge reach a designated swimming water", index=labels),
+        "monitoring": extract_after(lines, "Monitoring of the receiving water", index=labels),
+        "cleaned": extract_after(lines, "Was the affected area cleaned", index=labels),
+        "disinfected": extract_after(lines, "Was the affected area disinfected", index=labels),
+        "cause": extract_after(lines, "Known or suspected cause of the discharge", index=labels),
         "file_name": os.path.basename(file_path),
         "_ts": extract_submission_ts(text),
     }
 
+def _process_pdf_safe(path: str) -> Tuple[Optional[Dict[str, object]], str]:
+    """Run process_pdf in a worker; return (row, error) so one bad PDF can't stop the pool."""
+    try:
+        return process_pdf(path), ""
+    except Exception as e:
+        return None, str(e)
+
 def dedupe_keep_newest(rows: List[Dict[str, object]]) -> Dict[str, Dict[str, object]]:
     by_key: Dict[str, Dict[str, object]] = {}
     for r in rows:
@@ -254,6 +332,8 @@ _WORDS_TO_STRIP = re.compile(
     r"\b(city|town|village|county|water\s+and\s+sewer\s+board|water\s+&\s*sewer\s+board|utilities?\s+board|utility\s+board|board|department|authority|of|the)\b",
     re.I,
 )
+_ACRONYM_RE = re.compile(r"\(([A-Z]{2,6})\)")
+_MULTISPACE_RE = re.compile(r"\s{2,}")
 
 def utility_short_name(permittee: str) -> str:
     p = _clean(permittee)
@@ -264,13 +344,13 @@ def utility_short_name(permittee: str) -> str:
         if p.lower() == k.lower():
             return v
     # If an acronym appears in parentheses, prefer it: "… (BCSS)"
-    m = re.search(r"\(([A-Z]{2,6})\)", p)
+    m = _ACRONYM_RE.search(p)
     if m:
         return m.group(1)
     # Strip boilerplate words
     core = _WORDS_TO_STRIP.sub("", p).strip()
     # Collapse multiple spaces
-    core = re.sub(r"\s{2,}", " ", core)
+    core = _MULTISPACE_RE.sub(" ", core)
     # If the result is long, keep last 1–2 words; else keep as is
     parts = core.split()
     if len(parts) >= 2:
@@ -319,15 +399,16 @@ def main():
 
     rows: List[Dict[str, object]] = []
     missing_crit = 0
-    for path in pdf_paths:
-        try:
-            print(f"Processing: {os.path.basename(path)}")
-            row = process_pdf(path)
+    with ordered_process_map(_process_pdf_safe, pdf_paths, PARSE_WORKERS) as results:
+        # map() preserves input order, so de-dupe tie-breaking is unchanged.
+        for path, (row, error) in zip(pdf_paths, results):
+            if row is None:
+                print(f"Failed on {os.path.basename(path)}: {error}")
+                continue
+            print(f"Processed: {os.path.basename(path)}")
             rows.append(row)
             if not row.get("sso_id") or not row.get("start") or not row.get("volume"):
                 missing_crit += 1
-        except Exception as e:
-            print(f"Failed on {os.path.basename(path)}: {e}")
 
     # de-dupe by SSO id
     by_key = dedupe_keep_newest(rows)
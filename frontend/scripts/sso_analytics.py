@@ -1,18 +1,22 @@
 """Analytics and QA helpers for SSO records."""
 from __future__ import annotations
 
+import functools
+import heapq
 import re
 
+from bisect import bisect_right
+from collections import Counter, defaultdict
 from dataclasses import dataclass
-from datetime import datetime
-from statistics import mean, median
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from datetime import date, datetime
+from operator import attrgetter
+from typing import Any, Callable, DefaultDict, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 from typing import Literal
 
 from sso_schema import SSORecord
 
 
-@dataclass
+@dataclass(slots=True)
 class VolumeSummary:
     count: int
     total_volume_gallons: float
@@ -21,12 +25,12 @@ class VolumeSummary:
     max_volume_gallons: Optional[float]
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupVolumeSummary(VolumeSummary):
     group_key: str
 
 
-@dataclass
+@dataclass(slots=True)
 class SpillRecordSummary:
     sso_id: Optional[str]
     utility_name: Optional[str]
@@ -36,7 +40,7 @@ class SpillRecordSummary:
     description: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class DateSeriesPoint:
     date: str
     count: int
@@ -105,7 +109,7 @@ CONTAINED_PHRASES = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class QAIssue:
     severity: IssueSeverity
     code: str
@@ -114,14 +118,25 @@ class QAIssue:
     extra: Optional[Dict[str, Any]] = None
 
 
-def _usable_volume(record: SSORecord) -> Optional[float]:
-    if record.volume_gallons is None:
-        return None
-    if record.volume_gallons < 0:
-        return None
-    return record.volume_gallons
+def _keyword_re(keywords: Iterable[str]) -> re.Pattern[str]:
+    """Compile a substring alternation equivalent to ``any(kw in text ...)``."""
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords))
+
+
+_FILLER_RE = re.compile(
+    r'^(Provide the first named creek or river that receives the flow\.|Note:|Did the discharge).*$',
+    re.IGNORECASE,
+)
+_PAREN_NAME_RE = re.compile(r'\(([^)]+)\)')
+_NEGATIVE_WATERBODY_RE = _keyword_re(NEGATIVE_WATERBODY_PHRASES)
+_MAJOR_WATERBODY_RE = _keyword_re(MAJOR_WATERBODY_KEYWORDS)
+_OTHER_WATERBODY_RE = _keyword_re(OTHER_WATERBODY_KEYWORDS)
+_SECONDARY_WATERBODY_RE = _keyword_re(SECONDARY_WATERBODY_KEYWORDS)
+_CONTAINED_RE = _keyword_re(sorted(CONTAINED_PHRASES))
 
 
+# Receiving-water strings repeat heavily across records, so results are cached.
+@functools.lru_cache(maxsize=4096)
 def _normalize_receiving_water_name(raw_value: Optional[str]) -> Optional[str]:
     if not raw_value:
         return None
@@ -130,7 +145,7 @@ def _normalize_receiving_water_name(raw_value: Optional[str]) -> Optional[str]:
         return None
 
     # Handle common PDF filler text that might be captured
-    value = re.sub(r'^(Provide the first named creek or river that receives the flow\.|Note:|Did the discharge).*$', '', value, flags=re.IGNORECASE).strip()
+    value = _FILLER_RE.sub('', value).strip()
     if not value:
         return None
 
@@ -144,7 +159,7 @@ def _normalize_receiving_water_name(raw_value: Optional[str]) -> Optional[str]:
     for part in parts:
         # Check for parenthetical names which are often the primary waterbody
         # e.g., "Drainage Ditch(Coosa River)" -> "Coosa River"
-        paren_match = re.search(r'\(([^)]+)\)', part)
+        paren_match = _PAREN_NAME_RE.search(part)
         extracted_name = paren_match.group(1).strip() if paren_match else part
         
         # We consider both the extracted name and the full part
@@ -152,14 +167,14 @@ def _normalize_receiving_water_name(raw_value: Optional[str]) -> Optional[str]:
             lower_name = name.lower()
             
             # Skip if it contains negative phrases
-            if any(neg in lower_name for neg in NEGATIVE_WATERBODY_PHRASES):
+            if _NEGATIVE_WATERBODY_RE.search(lower_name):
                 continue
                 
-            if any(kw in lower_name for kw in MAJOR_WATERBODY_KEYWORDS):
+            if _MAJOR_WATERBODY_RE.search(lower_name):
                 major_candidates.append(name)
-            elif any(kw in lower_name for kw in OTHER_WATERBODY_KEYWORDS):
+            elif _OTHER_WATERBODY_RE.search(lower_name):
                 other_candidates.append(name)
-            elif any(kw in lower_name for kw in SECONDARY_WATERBODY_KEYWORDS):
+            elif _SECONDARY_WATERBODY_RE.search(lower_name):
                 secondary_candidates.append(name)
     
     if major_candidates:
@@ -171,7 +186,7 @@ def _normalize_receiving_water_name(raw_value: Optional[str]) -> Optional[str]:
 
     # Fallback to check for "contained" phrases if no specific waterbody found
     lower_value = value.lower()
-    if any(phrase in lower_value for phrase in CONTAINED_PHRASES):
+    if _CONTAINED_RE.search(lower_value):
         return CONTAINED_LABEL
 
     # Ultimate fallback: return the first part or the original value
@@ -181,37 +196,65 @@ def _normalize_receiving_water_name(raw_value: Optional[str]) -> Optional[str]:
 def _best_volume(record: SSORecord) -> Optional[float]:
     # We prioritize the calculated est_volume_gal if available, 
     # then fallback to the direct volume_gallons field.
-    if record.est_volume_gal is not None:
+    est_volume_gal = record.est_volume_gal
+    if est_volume_gal is not None:
+        # Ingestion always stores an int here; only odd inputs need the guard.
+        if type(est_volume_gal) is int:
+            return float(est_volume_gal)
         try:
-            return float(record.est_volume_gal)
+            return float(est_volume_gal)
         except (TypeError, ValueError):
             pass
-    return _usable_volume(record)
+    volume = record.volume_gallons
+    if volume is None or volume < 0:
+        return None
+    return volume
 
 
 def _volume_stats(volumes: List[float]) -> VolumeSummary:
+    """Summarize ``volumes``, which is sorted in place (callers pass scratch lists)."""
     count = len(volumes)
     if not volumes:
         return VolumeSummary(0, 0.0, None, None, None)
     total = float(sum(volumes))
+    # One sort yields both the median and the max; sorting in place skips a copy.
+    volumes.sort()
+    ordered = volumes
+    mid = count // 2
+    middle = ordered[mid] if count % 2 else (ordered[mid - 1] + ordered[mid]) / 2
     return VolumeSummary(
         count=count,
         total_volume_gallons=total,
-        mean_volume_gallons=mean(volumes),
-        median_volume_gallons=median(volumes),
-        max_volume_gallons=max(volumes),
+        mean_volume_gallons=total / count,
+        median_volume_gallons=middle,
+        max_volume_gallons=ordered[-1],
     )
 
 
-def summarize_overall_volume(records: Iterable[SSORecord]) -> VolumeSummary:
-    volumes = [vol for record in records if (vol := _usable_volume(record)) is not None]
+def summarize_overall_volume(records: Sequence[SSORecord]) -> VolumeSummary:
+    volumes = [
+        vol for record in records if (vol := record.volume_gallons) is not None and vol >= 0
+    ]
     return _volume_stats(volumes)
 
 
-def _summaries_from_groups(groups: Dict[str, List[float]]) -> List[GroupVolumeSummary]:
+def _summaries_from_groups(
+    groups: Dict[str, List[float]], top_n: Optional[int] = None
+) -> List[GroupVolumeSummary]:
+    # Decorate each group once with its sort key (the index keeps ties in
+    # insertion order), so totals and lowercased keys are computed a single
+    # time and medians are only computed for the groups that are kept.
+    decorated = [
+        (-float(sum(volumes)), key.lower(), index, key)
+        for index, (key, volumes) in enumerate(groups.items())
+    ]
+    decorated.sort()
+    if top_n is not None:
+        decorated = decorated[:top_n]
+
     summaries: List[GroupVolumeSummary] = []
-    for key, volumes in groups.items():
-        base = _volume_stats(volumes)
+    for _, _, _, key in decorated:
+        base = _volume_stats(groups[key])
         summaries.append(
             GroupVolumeSummary(
                 group_key=key,
@@ -222,71 +265,56 @@ def _summaries_from_groups(groups: Dict[str, List[float]]) -> List[GroupVolumeSu
                 max_volume_gallons=base.max_volume_gallons,
             )
         )
-    summaries.sort(
-        key=lambda item: (
-            -item.total_volume_gallons,
-            item.group_key.lower(),
-        )
-    )
     return summaries
 
 
-def summarize_volume_by_utility(records: Iterable[SSORecord]) -> List[GroupVolumeSummary]:
-    groups: Dict[str, List[float]] = {}
+def _group_usable_volumes(
+    records: Iterable[SSORecord], key_of: Callable[[SSORecord], Optional[str]]
+) -> Dict[str, List[float]]:
+    """Collect usable volumes per group key in one pass, skipping falsy keys."""
+    groups: DefaultDict[str, List[float]] = defaultdict(list)
     for record in records:
-        volume = _usable_volume(record)
-        if volume is None:
-            continue
-        if not record.utility_name:
+        volume = record.volume_gallons
+        if volume is None or volume < 0:
             continue
-        groups.setdefault(record.utility_name, []).append(volume)
-    return _summaries_from_groups(groups)
+        key = key_of(record)
+        if key:
+            groups[key].append(volume)
+    return groups
 
 
-def summarize_volume_by_county(records: Iterable[SSORecord]) -> List[GroupVolumeSummary]:
-    groups: Dict[str, List[float]] = {}
-    for record in records:
-        volume = _usable_volume(record)
-        if volume is None:
-            continue
-        if not record.county:
-            continue
-        groups.setdefault(record.county, []).append(volume)
-    return _summaries_from_groups(groups)
+def summarize_volume_by_utility(records: Sequence[SSORecord]) -> List[GroupVolumeSummary]:
+    return _summaries_from_groups(_group_usable_volumes(records, attrgetter("utility_name")))
 
 
-def summarize_volume_by_month(records: Iterable[SSORecord]) -> List[GroupVolumeSummary]:
-    groups: Dict[str, List[float]] = {}
-    for record in records:
-        volume = _usable_volume(record)
-        if volume is None:
-            continue
-        if not record.date_sso_began:
-            continue
-        key = record.date_sso_began.strftime("%Y-%m")
-        groups.setdefault(key, []).append(volume)
-    return _summaries_from_groups(groups)
+def summarize_volume_by_county(records: Sequence[SSORecord]) -> List[GroupVolumeSummary]:
+    return _summaries_from_groups(_group_usable_volumes(records, attrgetter("county")))
 
 
-def time_series_by_date(records: Iterable[SSORecord]) -> List[Dict[str, Any]]:
-    buckets: Dict[str, Dict[str, Any]] = {}
+def summarize_volume_by_month(records: Sequence[SSORecord]) -> List[GroupVolumeSummary]:
+    return _summaries_from_groups(_group_usable_volumes(records, _month_key))
+
+
+def time_series_by_date(records: Sequence[SSORecord]) -> List[Dict[str, Any]]:
+    # Keyed by day ordinal; the ISO string is only built once per emitted point.
+    counts: Counter[int] = Counter()
+    totals: DefaultDict[int, float] = defaultdict(float)
     for record in records:
         if not record.date_sso_began:
             continue
-        key = record.date_sso_began.strftime("%Y-%m-%d")
-        bucket = buckets.setdefault(key, {"count": 0, "volume": 0.0})
-        bucket["count"] += 1
+        key = record.date_sso_began.toordinal()
+        counts[key] += 1
         volume = _best_volume(record)
         if volume is not None:
-            bucket["volume"] += volume
+            totals[key] += volume
 
     points: List[Dict[str, Any]] = []
-    for key in sorted(buckets.keys()):
+    for key in sorted(counts):
         points.append(
             {
-                "date": key,
-                "count": buckets[key]["count"],
-                "volume": buckets[key]["volume"],
+                "date": date.fromordinal(key).isoformat(),
+                "count": counts[key],
+                "volume": totals.get(key, 0.0),
             }
         )
     return points
@@ -300,13 +328,53 @@ def _duration_hours(record: SSORecord) -> Optional[float]:
     return None
 
 
+# Dates cluster in a few hundred months/days, so memoized keys are shared string
+# objects whose hashes are computed once.
+@functools.lru_cache(maxsize=4096)
+def _month_str(year: int, month: int) -> str:
+    return f"{year:04d}-{month:02d}"
+
+
+@functools.lru_cache(maxsize=4096)
+def _day_str(year: int, month: int, day: int) -> str:
+    return f"{year:04d}-{month:02d}-{day:02d}"
+
+
 def _month_key(record: SSORecord) -> Optional[str]:
     if not record.date_sso_began:
         return None
-    return record.date_sso_began.strftime("%Y-%m")
+    dt = record.date_sso_began
+    return _month_str(dt.year, dt.month)
+
+
+def _usable_volume(record: SSORecord) -> Optional[float]:
+    vol = record.volume_gallons
+    return vol if vol is not None and vol >= 0 else None
+
+
+def _per_record(
+    records: Iterable[SSORecord],
+    *columns: Tuple[Optional[Sequence[Any]], Callable[[SSORecord], Any]],
+) -> Iterator[Tuple[Any, ...]]:
+    """Yield ``(record, value, ...)`` tuples in a single pass over ``records``.
+
+    Each column pairs the caller's precomputed per-record values (or None)
+    with the function deriving the value from a record, so one-shot iterators
+    are still read only once when nothing was precomputed.
+    """
+    if all(values is not None for values, _ in columns):
+        return zip(records, *(values for values, _ in columns))
+    sources = [iter(values) if values is not None else None for values, _ in columns]
+    derives = [derive for _, derive in columns]
+    return (
+        (record, *[next(src) if src is not None else derive(record) for src, derive in zip(sources, derives)])
+        for record in records
+    )
 
 
-def summarize_by_month(records: Sequence[SSORecord]) -> List[Dict[str, Any]]:
+def summarize_by_month(
+    records: Sequence[SSORecord], *, usable_volumes: Optional[Sequence[Optional[float]]] = None
+) -> List[Dict[str, Any]]:
     """Aggregate spill counts and volumes by month (YYYY-MM).
 
     Records without a ``date_sso_began`` are skipped because the month bucket
@@ -314,30 +382,34 @@ def summarize_by_month(records: Sequence[SSORecord]) -> List[Dict[str, Any]]:
     values and ignores ``None`` or negative entries.
     """
 
-    buckets: Dict[str, Dict[str, Any]] = {}
-    for record in records:
+    # Each bucket is a running [spill_count, volume_count, total, max] rather
+    # than a list of volumes summed and maxed afterwards.
+    buckets: Dict[str, List[Any]] = {}
+    for record, volume in _per_record(records, (usable_volumes, _usable_volume)):
         month = _month_key(record)
         if not month:
             continue
-        bucket = buckets.setdefault(month, {"spill_count": 0, "volumes": []})
-        bucket["spill_count"] += 1
-        volume = _usable_volume(record)
+        try:
+            bucket = buckets[month]
+        except KeyError:
+            bucket = buckets[month] = [0, 0, 0.0, None]
+        bucket[0] += 1
         if volume is not None:
-            bucket["volumes"].append(volume)
+            bucket[1] += 1
+            bucket[2] += volume
+            if bucket[3] is None or volume > bucket[3]:
+                bucket[3] = volume
 
     rows: List[Dict[str, Any]] = []
-    for month in sorted(buckets.keys()):
-        volumes = buckets[month]["volumes"]
-        total_volume = float(sum(volumes)) if volumes else 0.0
-        avg_volume = mean(volumes) if volumes else 0.0
-        max_volume = max(volumes) if volumes else 0.0
+    for month in sorted(buckets):
+        spill_count, volume_count, total_volume, max_volume = buckets[month]
         rows.append(
             {
                 "month": month,
-                "spill_count": buckets[month]["spill_count"],
+                "spill_count": spill_count,
                 "total_volume": total_volume,
-                "avg_volume": avg_volume,
-                "max_volume": max_volume,
+                "avg_volume": total_volume / volume_count if volume_count else 0.0,
+                "max_volume": max_volume if volume_count else 0.0,
             }
         )
     return rows
@@ -356,7 +428,12 @@ def _get_facility_name(record: SSORecord) -> Optional[str]:
     return str(raw.get("facility_site_name") or raw.get("facility") or raw.get("facility_name") or "") or None
 
 
-def summarize_by_utility(records: Sequence[SSORecord]) -> List[Dict[str, Any]]:
+def summarize_by_utility(
+    records: Sequence[SSORecord],
+    *,
+    utility_keys: Optional[Sequence[Optional[str]]] = None,
+    usable_volumes: Optional[Sequence[Optional[float]]] = None,
+) -> List[Dict[str, Any]]:
     """Summarize spills grouped by utility id/name.
 
     The grouping key prefers ``utility_id`` when available; otherwise it falls
@@ -365,19 +442,23 @@ def summarize_by_utility(records: Sequence[SSORecord]) -> List[Dict[str, Any]]:
     """
 
     buckets: Dict[str, Dict[str, Any]] = {}
-    for record in records:
-        group_key = _utility_group_key(record)
+    for record, group_key, volume in _per_record(
+        records, (utility_keys, _utility_group_key), (usable_volumes, _usable_volume)
+    ):
         if not group_key:
             continue
-        bucket = buckets.setdefault(
-            group_key,
-            {
+        # Build the bucket only on a miss; setdefault would allocate it per record.
+        try:
+            bucket = buckets[group_key]
+        except KeyError:
+            bucket = buckets[group_key] = {
                 "utility_id": record.utility_id,
                 "utility_name": record.utility_name,
                 "spill_count": 0,
-                "volumes": [],
-            },
-        )
+                "volume_count": 0,
+                "total_volume": 0.0,
+                "max_volume": None,
+            }
         # Preserve a readable utility_name even when grouped by ID only
         if not bucket.get("utility_name") and record.utility_name:
             bucket["utility_name"] = record.utility_name
@@ -387,9 +468,12 @@ def summarize_by_utility(records: Sequence[SSORecord]) -> List[Dict[str, Any]]:
             bucket["facility_name"] = _get_facility_name(record)
 
         bucket["spill_count"] += 1
-        volume = _usable_volume(record)
         if volume is not None:
-            bucket["volumes"].append(volume)
+            # Running aggregates instead of a per-utility list to sum and max later
+            bucket["volume_count"] += 1
+            bucket["total_volume"] += volume
+            if bucket["max_volume"] is None or volume > bucket["max_volume"]:
+                bucket["max_volume"] = volume
 
     # 2. Count occurrences of each name to detect duplicates
     name_counts: Dict[str, int] = {}
@@ -411,18 +495,16 @@ def summarize_by_utility(records: Sequence[SSORecord]) -> List[Dict[str, Any]]:
             elif data.get("utility_id") and data.get("utility_id") != original_name:
                 display_name = f"{original_name} ({data['utility_id']})"
 
-        volumes = data["volumes"]
-        total_volume = float(sum(volumes)) if volumes else 0.0
-        avg_volume = mean(volumes) if volumes else None
-        max_volume = max(volumes) if volumes else None
+        volume_count = data["volume_count"]
+        total_volume = data["total_volume"]
         rows.append(
             {
                 "utility_id": data.get("utility_id"),
                 "utility_name": display_name,
                 "spill_count": data["spill_count"],
                 "total_volume": total_volume,
-                "avg_volume": avg_volume,
-                "max_volume": max_volume,
+                "avg_volume": total_volume / volume_count if volume_count else None,
+                "max_volume": data["max_volume"],
             }
         )
 
@@ -442,46 +524,39 @@ def _bucket_label(lower: float, upper: Optional[float]) -> str:
     return f"{lower:,.0f}–{upper:,.0f}"
 
 
-def summarize_by_volume_bucket(records: Sequence[SSORecord]) -> List[Dict[str, Any]]:
+# Buckets are contiguous, so each upper bound is the next bucket's lower edge and
+# bisect_right over the upper bounds yields the bucket index for volumes >= 0.
+_BUCKET_EDGES = [upper for _, upper in VOLUME_BUCKETS if upper is not None]
+_BUCKET_LABELS = [_bucket_label(lower, upper) for lower, upper in VOLUME_BUCKETS]
+
+
+def summarize_by_volume_bucket(
+    records: Sequence[SSORecord], *, usable_volumes: Optional[Sequence[Optional[float]]] = None
+) -> List[Dict[str, Any]]:
     """Summarize spill counts and volumes grouped into size buckets.
 
     Records with missing or negative volumes are assigned to an ``unknown``
     bucket to avoid losing count information.
     """
 
-    buckets: Dict[str, Dict[str, Any]] = {}
-    for lower, upper in VOLUME_BUCKETS:
-        label = _bucket_label(lower, upper)
-        buckets[label] = {"spill_count": 0, "total_volume": 0.0}
-    buckets["unknown"] = {"spill_count": 0, "total_volume": 0.0}
-
-    for record in records:
-        volume = _usable_volume(record)
+    # Flat per-bucket tallies indexed by bisect position; only the volume
+    # matters here, so the records themselves are not revisited.
+    counts = [0] * len(_BUCKET_LABELS)
+    totals = [0.0] * len(_BUCKET_LABELS)
+    unknown_count = 0
+    for volume in usable_volumes if usable_volumes is not None else map(_usable_volume, records):
         if volume is None:
-            buckets["unknown"]["spill_count"] += 1
+            unknown_count += 1
             continue
+        idx = bisect_right(_BUCKET_EDGES, volume)
+        counts[idx] += 1
+        totals[idx] += volume
 
-        matched_label = None
-        for lower, upper in VOLUME_BUCKETS:
-            if upper is None:
-                if volume >= lower:
-                    matched_label = _bucket_label(lower, upper)
-                    break
-            elif lower <= volume < upper:
-                matched_label = _bucket_label(lower, upper)
-                break
-
-        if matched_label is None:
-            matched_label = "unknown"
-
-        buckets[matched_label]["spill_count"] += 1
-        buckets[matched_label]["total_volume"] += volume if volume is not None else 0.0
-
-    rows: List[Dict[str, Any]] = []
-    for lower, upper in VOLUME_BUCKETS:
-        label = _bucket_label(lower, upper)
-        rows.append({"bucket_label": label, **buckets[label]})
-    rows.append({"bucket_label": "unknown", **buckets["unknown"]})
+    rows: List[Dict[str, Any]] = [
+        {"bucket_label": label, "spill_count": count, "total_volume": total}
+        for label, count, total in zip(_BUCKET_LABELS, counts, totals)
+    ]
+    rows.append({"bucket_label": "unknown", "spill_count": unknown_count, "total_volume": 0.0})
     return rows
 
 
@@ -492,8 +567,13 @@ def _date_bounds(records: Sequence[SSORecord]) -> tuple[Optional[datetime], Opti
     return min(dates), max(dates)
 
 
-def build_time_series(records: Sequence[SSORecord]) -> Dict[str, Any]:
+def build_time_series(
+    records: Sequence[SSORecord], *, best_volumes: Optional[Sequence[Optional[float]]] = None
+) -> Dict[str, Any]:
     """Build time series with automatic granularity based on date span."""
+    # The date span must be known before bucketing, so this needs two passes.
+    if not isinstance(records, (list, tuple)):
+        records = list(records)
     min_date, max_date = _date_bounds(records)
     if not min_date or not max_date:
         return {"granularity": "none", "points": []}
@@ -509,7 +589,7 @@ def build_time_series(records: Sequence[SSORecord]) -> Dict[str, Any]:
         granularity = "day"
 
     buckets: dict[str, dict[str, Any]] = {}
-    for record in records:
+    for record, volume in _per_record(records, (best_volumes, _best_volume)):
         if not record.date_sso_began:
             continue
         dt = record.date_sso_began
@@ -518,50 +598,54 @@ def build_time_series(records: Sequence[SSORecord]) -> Dict[str, Any]:
             key = str(dt.year)
             label = str(dt.year)
         elif granularity == "month":
-            key = f"{dt.year:04d}-{dt.month:02d}"
+            key = _month_str(dt.year, dt.month)
             label = f"{dt.year}-{dt.month:02d}"
         else:
-            key = dt.strftime("%Y-%m-%d")
+            key = _day_str(dt.year, dt.month, dt.day)
             label = key
 
-        bucket = buckets.setdefault(
-            key,
-            {
+        try:
+            bucket = buckets[key]
+        except KeyError:
+            bucket = buckets[key] = {
                 "date": key,
                 "period_label": label,
                 "count": 0,
                 "volume": 0.0,
-            },
-        )
+            }
         bucket["count"] += 1
-        volume = _best_volume(record)
         bucket["volume"] += volume if volume is not None else 0.0
 
     points = [buckets[key] for key in sorted(buckets.keys())]
     return {"granularity": granularity, "points": points}
 
 
-def summarize_top_utilities(records: Sequence[SSORecord]) -> List[Dict[str, Any]]:
+def summarize_top_utilities(
+    records: Sequence[SSORecord],
+    *,
+    best_volumes: Optional[Sequence[Optional[float]]] = None,
+    utility_keys: Optional[Sequence[Optional[str]]] = None,
+) -> List[Dict[str, Any]]:
     buckets: dict[str, dict[str, Any]] = {}
-    for record in records:
-        key = _utility_group_key(record)
+    for record, volume, key in _per_record(
+        records, (best_volumes, _best_volume), (utility_keys, _utility_group_key)
+    ):
         if not key:
             continue
-        bucket = buckets.setdefault(
-            key,
-            {
+        try:
+            bucket = buckets[key]
+        except KeyError:
+            bucket = buckets[key] = {
                 "utility_id": record.utility_id or key,
                 "utility_name": record.utility_name or key,
                 "spill_count": 0,
                 "total_volume_gallons": 0.0,
-            },
-        )
+            }
         
         if not bucket.get("facility_name"):
             bucket["facility_name"] = _get_facility_name(record)
 
         bucket["spill_count"] += 1
-        volume = _best_volume(record)
         bucket["total_volume_gallons"] += volume if volume is not None else 0.0
 
     # Disambiguate names
@@ -598,37 +682,37 @@ def summarize_top_receiving_waters(records: Sequence[SSORecord]) -> List[Dict[st
 
 
 def summarize_by_receiving_water(
-    records: Sequence[SSORecord], *, top_n: Optional[int] = None
+    records: Sequence[SSORecord],
+    *,
+    top_n: Optional[int] = None,
+    best_volumes: Optional[Sequence[Optional[float]]] = None,
 ) -> List[Dict[str, Any]]:
-    buckets: dict[str, dict[str, Any]] = {}
+    counts: Counter[str] = Counter()
+    totals: DefaultDict[str, float] = defaultdict(float)
 
-    for record in records:
-        name = _normalize_receiving_water_name(record.receiving_water)
-        label = name or "Unknown"
-        bucket = buckets.setdefault(
-            label,
-            {
-                "name": label,
-                "receiving_water": label,
-                "receiving_water_name": label,
-                "spill_count": 0,
-                "total_volume_gallons": 0.0,
-            },
-        )
-        bucket["spill_count"] += 1
-        volume = _best_volume(record)
-        bucket["total_volume_gallons"] += volume if volume is not None else 0.0
+    for record, volume in _per_record(records, (best_volumes, _best_volume)):
+        label = _normalize_receiving_water_name(record.receiving_water) or "Unknown"
+        counts[label] += 1
+        if volume is not None:
+            totals[label] += volume
+
+    rows = [
+        {
+            "name": label,
+            "receiving_water": label,
+            "receiving_water_name": label,
+            "spill_count": count,
+            "total_volume_gallons": totals.get(label, 0.0),
+        }
+        for label, count in counts.items()
+    ]
+    def sort_key(row: Dict[str, Any]) -> Tuple[float, int, str]:
+        return (-row["total_volume_gallons"], -row["spill_count"], row.get("receiving_water_name") or "")
 
-    rows = list(buckets.values())
-    rows.sort(
-        key=lambda row: (
-            -row["total_volume_gallons"],
-            -row["spill_count"],
-            row.get("receiving_water_name") or "",
-        )
-    )
+    # The dashboard only wants the leaders, so avoid sorting every water body.
     if top_n is not None:
-        rows = rows[:top_n]
+        return heapq.nsmallest(top_n, rows, key=sort_key)
+    rows.sort(key=sort_key)
     return rows
 
 
@@ -659,16 +743,31 @@ def build_dashboard_summary(
 ) -> Dict[str, Any]:
     """Build a dashboard-friendly summary payload."""
 
-    volumes = [vol for vol in (_best_volume(record) for record in records) if vol is not None]
-    total_volume = float(sum(volumes)) if volumes else 0.0
-    avg_volume = mean(volumes) if volumes else 0.0
-    max_volume = max(volumes) if volumes else 0.0
-
+    # Every summarizer below re-reads the records, so a one-shot iterator
+    # would be exhausted after the first; materialize it once up front.
+    if not isinstance(records, (list, tuple)):
+        records = list(records)
+
+    # One pass gathers every per-record input of the headline numbers; the
+    # best/usable volumes and utility keys are also handed to the summarizers
+    # below so they need not re-derive them per record.
+    best_volumes: list[Optional[float]] = []
+    usable_volumes: list[Optional[float]] = []
+    utility_keys: list[Optional[str]] = []
+    volumes: list[float] = []
     utilities = set()
     receiving_waters = set()
     duration_hours: list[float] = []
+    date_values: list[datetime] = []
     for record in records:
+        vol = _best_volume(record)
+        best_volumes.append(vol)
+        usable = record.volume_gallons
+        usable_volumes.append(usable if usable is not None and usable >= 0 else None)
+        if vol is not None:
+            volumes.append(vol)
         key = _utility_group_key(record)
+        utility_keys.append(key)
         if key:
             utilities.add(key)
         if record.receiving_water:
@@ -676,8 +775,13 @@ def build_dashboard_summary(
         dur = _duration_hours(record)
         if dur is not None:
             duration_hours.append(dur)
+        if record.date_sso_began:
+            date_values.append(record.date_sso_began)
+
+    total_volume = float(sum(volumes)) if volumes else 0.0
+    avg_volume = total_volume / len(volumes) if volumes else 0.0
+    max_volume = max(volumes) if volumes else 0.0
 
-    date_values = [record.date_sso_began for record in records if record.date_sso_began]
     date_min = min(date_values).date().isoformat() if date_values else None
     date_max = max(date_values).date().isoformat() if date_values else None
 
@@ -685,9 +789,9 @@ def build_dashboard_summary(
         date_min = date_range.get("min") or date_min
         date_max = date_range.get("max") or date_max
 
-    time_series = build_time_series(records)
-    top_utils = summarize_top_utilities(records)
-    by_receiving_water = summarize_by_receiving_water(records, top_n=10)
+    time_series = build_time_series(records, best_volumes=best_volumes)
+    top_utils = summarize_top_utilities(records, best_volumes=best_volumes, utility_keys=utility_keys)
+    by_receiving_water = summarize_by_receiving_water(records, top_n=10, best_volumes=best_volumes)
 
     payload: Dict[str, Any] = {
         "summary_counts": {
@@ -721,103 +825,74 @@ def build_dashboard_summary(
             }
             for item in by_receiving_water
         ],
-        "by_month": summarize_by_month(records),
-        "by_utility": summarize_by_utility(records),
-        "by_volume_bucket": summarize_by_volume_bucket(records),
+        "by_month": summarize_by_month(records, usable_volumes=usable_volumes),
+        "by_utility": summarize_by_utility(
+            records, utility_keys=utility_keys, usable_volumes=usable_volumes
+        ),
+        "by_volume_bucket": summarize_by_volume_bucket(records, usable_volumes=usable_volumes),
         "volume_analogies": compute_volume_analogies(total_volume),
     }
 
     return payload
 
 
+_DIGIT_RE = re.compile(r"\d")
+_GAL_RE = re.compile("gal", re.IGNORECASE)
+
+
 def _detect_volume_range_text(raw: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     for key, value in raw.items():
         if not isinstance(value, str):
             continue
-        value_lower = value.lower()
-        if "gal" not in value_lower:
-            continue
-        if ("<" in value_lower or ">" in value_lower) and any(
-            char.isdigit() for char in value_lower
-        ):
+        # Cheapest test first; the regexes match case-insensitively without
+        # allocating a lowered copy of every raw string.
+        if ("<" in value or ">" in value) and _GAL_RE.search(value) and _DIGIT_RE.search(value):
             return {"field": key, "value": value}
     return None
 
 
-def run_basic_qa(records: Iterable[SSORecord]) -> List[QAIssue]:
-    issues: List[QAIssue] = []
-
+def iter_basic_qa(records: Iterable[SSORecord]) -> Iterator[QAIssue]:
+    """Yield QA issues lazily so callers only pay for the issues they consume."""
     for record in records:
+        # Each field is read once; QAIssue takes (severity, code, message, sso_id, extra).
+        sso_id = record.sso_id
         volume = record.volume_gallons
         if volume is not None:
             if volume < 0:
-                issues.append(
-                    QAIssue(
-                        severity="error",
-                        code="NEGATIVE_VOLUME",
-                        message="Volume is negative",
-                        sso_id=record.sso_id,
-                        extra={"volume_gallons": volume},
-                    )
+                yield QAIssue(
+                    "error", "NEGATIVE_VOLUME", "Volume is negative", sso_id, {"volume_gallons": volume}
                 )
             elif volume == 0:
-                issues.append(
-                    QAIssue(
-                        severity="warning",
-                        code="ZERO_VOLUME",
-                        message="Volume is zero",
-                        sso_id=record.sso_id,
-                    )
-                )
+                yield QAIssue("warning", "ZERO_VOLUME", "Volume is zero", sso_id)
 
         if record.date_sso_began is None:
-            issues.append(
-                QAIssue(
-                    severity="warning",
-                    code="MISSING_START_DATE",
-                    message="date_sso_began is missing",
-                    sso_id=record.sso_id,
-                )
-            )
+            yield QAIssue("warning", "MISSING_START_DATE", "date_sso_began is missing", sso_id)
 
         if not record.utility_name:
-            issues.append(
-                QAIssue(
-                    severity="warning",
-                    code="MISSING_UTILITY",
-                    message="utility_name is missing",
-                    sso_id=record.sso_id,
-                )
-            )
+            yield QAIssue("warning", "MISSING_UTILITY", "utility_name is missing", sso_id)
 
         if record.x is None or record.y is None:
-            issues.append(
-                QAIssue(
-                    severity="warning",
-                    code="MISSING_GEOMETRY",
-                    message="Missing x or y coordinate",
-                    sso_id=record.sso_id,
-                )
-            )
+            yield QAIssue("warning", "MISSING_GEOMETRY", "Missing x or y coordinate", sso_id)
 
-        range_info = _detect_volume_range_text(record.raw)
+        raw = record.raw
+        range_info = _detect_volume_range_text(raw) if raw else None
         if range_info:
-            issues.append(
-                QAIssue(
-                    severity="info",
-                    code="VOLUME_RANGE_TEXT",
-                    message="Possible volume range description in raw text",
-                    sso_id=record.sso_id,
-                    extra=range_info,
-                )
+            yield QAIssue(
+                "info",
+                "VOLUME_RANGE_TEXT",
+                "Possible volume range description in raw text",
+                sso_id,
+                range_info,
             )
 
-    return issues
+
+def run_basic_qa(records: Sequence[SSORecord]) -> List[QAIssue]:
+    return list(iter_basic_qa(records))
 
 
 def top_utilities_by_volume(records: Iterable[SSORecord], n: int = 10) -> List[GroupVolumeSummary]:
-    summaries = summarize_volume_by_utility(records)
-    return summaries[:n]
+    groups = _group_usable_volumes(records, attrgetter("utility_name"))
+    return _summaries_from_groups(groups, top_n=n)
 
 
 def top_spills_by_volume(records: Iterable[SSORecord], n: int = 10) -> List[SpillRecordSummary]:
@@ -826,7 +901,9 @@ def top_spills_by_volume(records: Iterable[SSORecord], n: int = 10) -> List[Spil
         for record in records
         if record.volume_gallons is not None and record.volume_gallons >= 0
     ]
-    sorted_records = sorted(
+    # Same ordering as a full sort, but only an n-sized heap is maintained.
+    top_records = heapq.nsmallest(
+        n,
         usable_records,
         key=lambda record: (
             -(record.volume_gallons or 0),
@@ -834,7 +911,6 @@ def top_spills_by_volume(records: Iterable[SSORecord], n: int = 10) -> List[Spil
             record.utility_name or "",
         ),
     )
-    top_records = sorted_records[:n]
     return [
         SpillRecordSummary(
             sso_id=record.sso_id,
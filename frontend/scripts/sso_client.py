@@ -1,13 +1,22 @@
 """SSO ArcGIS client for downloading sanitary sewer overflow records."""
 from __future__ import annotations
 
+import functools
+import itertools
 import logging
 import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from datetime import date, datetime
+from operator import itemgetter
+from typing import Any, Deque, Dict, Iterator, List, Optional
 
+import orjson
 import requests
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
 
 from sso_schema import (
     COUNTY_FIELD,
@@ -17,24 +26,107 @@ from sso_schema import (
     UTILITY_NAME_FIELD,
     SSOQuery,
 )
-from sso_transform import PERMITTEE_MAP, simplify_permittee_name, generate_slug
+from sso_transform import canonical_permittee_name, generate_slug
 
 DEFAULT_BASE_URL = "https://gis.adem.alabama.gov/arcgis/rest/services/SSOs_ALL_OB_ID/MapServer/0/query"
 DEFAULT_PAGE_SIZE = 2000
 MAX_REASONABLE_RECORDS = 250_000
+METADATA_CACHE_TTL = 360  # seconds; matches the web layer's options cache
 
 logger = logging.getLogger(__name__)
 
+_get_attributes = itemgetter("attributes")
+# Categorical attributes repeated across thousands of features; interning them
+# at ingest lets every record (and every group-by dict) share one string.
+_INTERNED_FIELDS = (UTILITY_ID_FIELD, UTILITY_NAME_FIELD, COUNTY_FIELD)
+
 
 class SSOClientError(RuntimeError):
     """Error raised for SSO client failures."""
 
 
-@dataclass
+@functools.lru_cache(maxsize=256)
+def _parse_query_date(value: str) -> date:
+    """Parse a ``YYYY-MM-DD`` query bound, trying the C ISO parser first."""
+    # Only the zero-padded shape takes the fast path: Python 3.11's
+    # fromisoformat also accepts forms strptime rejects (e.g. "20240105").
+    if len(value) == 10 and value[4] == "-" and value[7] == "-":
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            pass
+    # strptime also accepts unpadded months/days such as "2024-1-5" and
+    # raises the error message callers have always seen.
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
+def _page_records(features: List[Dict[str, Any]]) -> Iterator[dict]:
+    """Yield flat records (attributes plus x/y) from one page of features."""
+    for feature in features:
+        try:
+            attrs = _get_attributes(feature)
+        except KeyError:
+            continue
+        for field in _INTERNED_FIELDS:
+            value = attrs.get(field)
+            if type(value) is str:
+                attrs[field] = sys.intern(value)
+        # The decoded page is private to the caller, so the attributes dict is
+        # extended in place rather than copied.
+        geometry = feature.get("geometry")
+        if geometry:
+            attrs["x"] = geometry.get("x")
+            attrs["y"] = geometry.get("y")
+        else:
+            attrs["x"] = attrs["y"] = None
+        yield attrs
+
+
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+_REPO_ROOT = os.path.abspath(os.path.join(_SCRIPT_DIR, ".."))
+CA_CHAIN_SEARCH_PATHS = (
+    os.path.join(_SCRIPT_DIR, "adem_ca_chain.pem"), # scripts/adem_ca_chain.pem
+    os.path.join(_REPO_ROOT, "adem_ca_chain.pem"),  # root/adem_ca_chain.pem
+    os.path.join(_REPO_ROOT, "frontend", "adem_ca_chain.pem"), # frontend/adem_ca_chain.pem
+    os.path.join(_REPO_ROOT, "api", "adem_ca_chain.pem"), # api/adem_ca_chain.pem
+    os.path.join(_REPO_ROOT, "frontend", "api", "adem_ca_chain.pem"), # frontend/api/adem_ca_chain.pem
+    "/var/task/adem_ca_chain.pem",
+    "/var/task/api/adem_ca_chain.pem",
+    "/var/task/frontend/adem_ca_chain.pem",
+    "adem_ca_chain.pem",
+)
+
+
+@functools.cache
+def _resolve_ca_bundle() -> bool | str:
+    """Locate the ADEM CA chain once per process.
+
+    Each serverless invocation may build a new ``SSOClient``; caching the
+    lookup means only the first instance pays for the filesystem probes.
+    """
+
+    path = next((p for p in CA_CHAIN_SEARCH_PATHS if os.path.exists(p)), None)
+    if path is not None:
+        logger.info(f"Using ADEM CA chain found at: {path}")
+        return path
+
+    # Fallback: In Vercel (/var/task exists), if we can't find our cert,
+    # we might have to disable verification or rely on system (which likely fails).
+    if os.path.exists("/var/task"):
+        logger.error("Running on Vercel but adem_ca_chain.pem not found in any search path!")
+        # We'll leave verify = True (system default) but it will likely fail
+        # if the server is still misconfigured.
+    else:
+        logger.debug("No custom CA chain found; using system defaults.")
+    return True
+
+
+@dataclass(slots=True)
 class SSOClientConfig:
     base_url: str = DEFAULT_BASE_URL
     api_key: Optional[str] = None
     timeout: int = 30
+    page_workers: int = 1
 
     @classmethod
     def from_env(cls) -> "SSOClientConfig":
@@ -42,6 +134,7 @@ class SSOClientConfig:
             base_url=os.getenv("SSO_API_BASE_URL", DEFAULT_BASE_URL),
             api_key=os.getenv("SSO_API_KEY"),
             timeout=int(os.getenv("SSO_API_TIMEOUT", "30")),
+            page_workers=int(os.getenv("SSO_PAGE_WORKERS", "1")),
         )
 
 
@@ -52,14 +145,27 @@ class SSOClient:
         api_key: str | None = None,
         timeout: int = 30,
         session: requests.Session | None = None,
+        page_workers: int | None = None,
     ) -> None:
         config = SSOClientConfig.from_env()
         self.base_url = base_url or config.base_url
         self.api_key = api_key or config.api_key
         self.timeout = timeout if timeout is not None else config.timeout
-        self.session = session or requests.Session()
+        # Pages fetched in parallel once the total count is known; 1 keeps the
+        # sequential offset loop.
+        self.page_workers = page_workers if page_workers is not None else config.page_workers
+        if session is None:
+            session = requests.Session()
+            # Keep one kept-alive connection per page worker; the default pool
+            # would discard (and later re-handshake) connections beyond 10.
+            adapter = HTTPAdapter(pool_maxsize=max(DEFAULT_POOLSIZE, self.page_workers))
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
         self._supports_pagination: Optional[bool] = None
         self._max_record_count: Optional[int] = None
+        self._metadata_rows: Optional[list[dict[str, Any]]] = None
+        self._metadata_fetched_at = 0.0
 
         # SSL Configuration
         self.verify: bool | str = True
@@ -80,38 +186,7 @@ class SSOClient:
         
         else:
             # Priority 3: Search for ADEM CA chain in known locations
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            repo_root = os.path.abspath(os.path.join(script_dir, ".."))
-            
-            cert_paths = [
-                os.path.join(script_dir, "adem_ca_chain.pem"), # scripts/adem_ca_chain.pem
-                os.path.join(repo_root, "adem_ca_chain.pem"),  # root/adem_ca_chain.pem
-                os.path.join(repo_root, "frontend", "adem_ca_chain.pem"), # frontend/adem_ca_chain.pem
-                os.path.join(repo_root, "api", "adem_ca_chain.pem"), # api/adem_ca_chain.pem
-                os.path.join(repo_root, "frontend", "api", "adem_ca_chain.pem"), # frontend/api/adem_ca_chain.pem
-                "/var/task/adem_ca_chain.pem",
-                "/var/task/api/adem_ca_chain.pem",
-                "/var/task/frontend/adem_ca_chain.pem",
-                "adem_ca_chain.pem",
-            ]
-            
-            cert_found = False
-            for path in cert_paths:
-                if os.path.exists(path):
-                    self.verify = path
-                    logger.info(f"Using ADEM CA chain found at: {path}")
-                    cert_found = True
-                    break
-            
-            if not cert_found:
-                # Fallback: In Vercel (/var/task exists), if we can't find our cert, 
-                # we might have to disable verification or rely on system (which likely fails).
-                if os.path.exists("/var/task"):
-                    logger.error("Running on Vercel but adem_ca_chain.pem not found in any search path!")
-                    # We'll leave self.verify = True (system default) but it will likely fail 
-                    # if the server is still misconfigured.
-                else:
-                    logger.debug("No custom CA chain found; using system defaults.")
+            self.verify = _resolve_ca_bundle()
 
     def _get(self, params: Dict[str, Any], *, url: Optional[str] = None) -> Dict[str, Any]:
         response = self.session.get(
@@ -121,19 +196,22 @@ class SSOClient:
             verify=self.verify
         )
         if not response.ok:
-            raise SSOClientError(
-                f"Request failed with status {response.status_code}: {response.text[:200]}"
-            )
+            # Decode just the preview; response.text would run charset
+            # detection over, and decode, the whole error body.
+            preview = response.content[:200].decode("utf-8", "replace")
+            raise SSOClientError(f"Request failed with status {response.status_code}: {preview}")
         try:
-            data = response.json()
-            if "error" in data:
-                err = data["error"]
-                raise SSOClientError(
-                    f"ArcGIS Error {err.get('code')}: {err.get('message')} - {err.get('details')}"
-                )
-            return data
-        except ValueError as exc:  # pragma: no cover - defensive
+            # orjson decodes the raw bytes directly, skipping requests' text
+            # decoding and the slower stdlib json parser on large pages.
+            data = orjson.loads(response.content)
+        except ValueError as exc:  # orjson.JSONDecodeError subclasses ValueError
             raise SSOClientError("Failed to decode JSON response") from exc
+        if "error" in data:
+            err = data["error"]
+            raise SSOClientError(
+                f"ArcGIS Error {err.get('code')}: {err.get('message')} - {err.get('details')}"
+            )
+        return data
 
     def _load_layer_metadata(self) -> tuple[Optional[bool], Optional[int]]:
         if self._supports_pagination is not None and self._max_record_count is not None:
@@ -156,7 +234,7 @@ class SSOClient:
 
         return self._supports_pagination, self._max_record_count
 
-    def fetch_ssos(
+    def iter_ssos(
         self,
         query: SSOQuery | None = None,
         utility_id: str | None = None,
@@ -164,9 +242,22 @@ class SSOClient:
         county: str | None = None,
         start_date: str | None = None,
         end_date: str | None = None,
-        limit: int | None = None,
         extra_params: dict | None = None,
-    ) -> list[dict]:
+        *,
+        limit: int | None = None,
+    ) -> Iterator[dict]:
+        """Yield raw SSO records one at a time, requesting pages lazily.
+
+        Consumers that stream (CSV export, normalization) only hold one page
+        in memory; the next page is requested once the current one is drained.
+        With ``page_workers > 1`` the total is counted first and up to
+        ``page_workers`` pages are fetched concurrently, still yielded in
+        offset order. At most ``limit`` records are yielded, and no page is
+        requested once the limit is reached.
+        """
+        if limit is not None and limit <= 0:
+            return
+
         params: Dict[str, Any] = {
             "outFields": "*",
             "outSR": "4326",
@@ -189,49 +280,130 @@ class SSOClient:
 
         supports_pagination, max_record_count = self._load_layer_metadata()
 
-        offset = 0
         page_size = int(params.pop("resultRecordCount", DEFAULT_PAGE_SIZE))
         if max_record_count:
             page_size = min(page_size, int(max_record_count))
-        records: List[Dict[str, Any]] = []
 
+        if supports_pagination and self.page_workers > 1:
+            records = self._iter_pages_concurrently(params, page_size, limit)
+        else:
+            records = self._iter_pages(params, page_size, supports_pagination)
+        try:
+            for count, record in enumerate(records, start=1):
+                yield record
+                # Stop before the next page is requested, not after it arrives.
+                if limit is not None and count >= limit:
+                    return
+        finally:
+            records.close()
+
+    def _iter_pages(
+        self, params: Dict[str, Any], page_size: int, supports_pagination: Optional[bool]
+    ) -> Iterator[dict]:
+        if not supports_pagination:
+            # The layer ignores offsets, so one request returns all it will give.
+            yield from _page_records(self._get(params).get("features") or [])
+            return
+
+        # Only the offset changes between pages. Each request still gets its
+        # own mapping, since callers (and session hooks) may keep the one they saw.
+        params["resultRecordCount"] = page_size
+        offset = 0
         while True:
-            page_params = dict(params)
-            if supports_pagination:
-                page_params["resultOffset"] = offset
-                page_params["resultRecordCount"] = page_size
-            data = self._get(page_params)
+            data = self._get({**params, "resultOffset": offset})
 
-            feature_list: List[Dict[str, Any]] = list(data.get("features", []) or [])
+            # The decoded list is already private to this call; no copy needed.
+            feature_list: List[Dict[str, Any]] = data.get("features") or []
             if not feature_list:
                 break
 
-            for feature in feature_list:
-                attrs = dict(feature.get("attributes", {}))
-                geometry = feature.get("geometry") or {}
-                attrs["x"] = geometry.get("x")
-                attrs["y"] = geometry.get("y")
-                records.append(attrs)
-                if limit is not None and len(records) >= limit:
-                    return records[:limit]
+            yield from _page_records(feature_list)
 
             offset += len(feature_list)
 
-            if limit is not None and len(records) >= limit:
-                return records[:limit]
-
             if len(feature_list) < page_size:
                 break
 
-            if len(records) > MAX_REASONABLE_RECORDS:
+            if offset > MAX_REASONABLE_RECORDS:
                 logger.warning(
-                    "Fetched %s records which exceeds the expected upper bound.", len(records)
+                    "Fetched %s records which exceeds the expected upper bound.", offset
                 )
 
-            if not supports_pagination:
-                break
+    def _count_records(self, params: Dict[str, Any]) -> int:
+        count_params = {k: v for k, v in params.items() if k not in ("outFields", "outSR")}
+        count_params["returnCountOnly"] = "true"
+        data = self._get(count_params)
+        try:
+            return int(data.get("count") or 0)
+        except (TypeError, ValueError) as exc:
+            raise SSOClientError("ArcGIS count response was not numeric") from exc
+
+    def _iter_pages_concurrently(
+        self, params: Dict[str, Any], page_size: int, limit: int | None
+    ) -> Iterator[dict]:
+        total = self._count_records(params)
+        if limit is not None:
+            total = min(total, limit)
+        if total > MAX_REASONABLE_RECORDS:
+            logger.warning("Query matches %s records which exceeds the expected upper bound.", total)
+        offsets = iter(range(0, total, page_size))
+
+        def fetch_page(offset: int) -> List[Dict[str, Any]]:
+            # A page can come back short (transfer limit, or a server cap below
+            # maxRecordCount); keep requesting from where it stopped so no
+            # records fall between this page and the next one.
+            end = min(offset + page_size, total)
+            features: List[Dict[str, Any]] = []
+            while offset < end:
+                data = self._get({**params, "resultOffset": offset, "resultRecordCount": end - offset})
+                batch = data.get("features") or []
+                if not batch:
+                    break  # rows removed since the count; nothing further to fetch
+                features.extend(batch)
+                offset += len(batch)
+            return features
+
+        # Only page_workers pages are in flight at once, so memory stays
+        # bounded like the sequential loop; results are consumed in offset order.
+        # requests.Session is shared across the threads.
+        pool = ThreadPoolExecutor(max_workers=self.page_workers)
+        try:
+            pending: Deque[Future] = deque(
+                pool.submit(fetch_page, offset) for offset in itertools.islice(offsets, self.page_workers)
+            )
+            while pending:
+                features = pending.popleft().result()
+                next_offset = next(offsets, None)
+                if next_offset is not None:
+                    pending.append(pool.submit(fetch_page, next_offset))
+                yield from _page_records(features)
+        finally:
+            # A consumer that stops early (or an error) drops the pages not yet requested.
+            pool.shutdown(wait=True, cancel_futures=True)
 
-        return records
+    def fetch_ssos(
+        self,
+        query: SSOQuery | None = None,
+        utility_id: str | None = None,
+        utility_name: str | None = None,
+        county: str | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        limit: int | None = None,
+        extra_params: dict | None = None,
+    ) -> list[dict]:
+        records = self.iter_ssos(
+            query=query,
+            utility_id=utility_id,
+            utility_name=utility_name,
+            county=county,
+            start_date=start_date,
+            end_date=end_date,
+            extra_params=extra_params,
+            limit=limit,
+        )
+        # islice stops pulling once the limit is met, so no further pages are requested.
+        return list(itertools.islice(records, limit))
 
     def _build_where_clause(
         self,
@@ -262,9 +434,9 @@ class SSOClient:
         start = None
         end = None
         if start_date:
-            start = datetime.strptime(start_date, "%Y-%m-%d").date()
+            start = _parse_query_date(start_date)
         if end_date:
-            end = datetime.strptime(end_date, "%Y-%m-%d").date()
+            end = _parse_query_date(end_date)
         return SSOQuery(
             utility_id=utility_id,
             utility_name=utility_name,
@@ -287,19 +459,42 @@ class SSOClient:
         if order_by:
             params["orderByFields"] = order_by
         data = self._get(params)
-        feature_list: list[dict[str, Any]] = list(data.get("features", []) or [])
         values: list[dict[str, Any]] = []
-        for feature in feature_list:
-            attrs = dict(feature.get("attributes", {}))
-            values.append(attrs)
+        for feature in data.get("features", []) or []:
+            try:
+                values.append(_get_attributes(feature))
+            except KeyError:
+                continue
         return values
 
+    def prefetch_metadata(self) -> list[dict[str, Any]]:
+        """Fetch distinct utility and county values in a single request.
+
+        ``list_utilities``, ``list_counties`` and ``permittee_permit_map`` all
+        read from this result, which is cached on the client for
+        ``METADATA_CACHE_TTL`` seconds, so a dashboard cold start costs one
+        ArcGIS round-trip instead of three.
+        """
+
+        now = time.monotonic()
+        if (
+            self._metadata_rows is not None
+            and now - self._metadata_fetched_at < METADATA_CACHE_TTL
+        ):
+            return self._metadata_rows
+
+        rows = self._distinct_values(
+            [UTILITY_ID_FIELD, UTILITY_NAME_FIELD, COUNTY_FIELD],
+            order_by=UTILITY_NAME_FIELD,
+        )
+        self._metadata_rows = rows
+        self._metadata_fetched_at = now
+        return rows
+
     def list_utilities(self) -> list[dict[str, str]]:
         """Return distinct utilities available in the ArcGIS layer."""
 
-        raw_utilities = self._distinct_values(
-            [UTILITY_ID_FIELD, UTILITY_NAME_FIELD], order_by=UTILITY_NAME_FIELD
-        )
+        raw_utilities = self.prefetch_metadata()
         seen: dict[str, dict[str, str]] = {}
         for attrs in raw_utilities:
             utility_id = str(attrs.get(UTILITY_ID_FIELD) or "").strip()
@@ -308,31 +503,25 @@ class SSOClient:
                 continue
             key = utility_id or utility_name
             existing = seen.get(key)
-            if existing:
-                if utility_name and not existing.get("name"):
-                    existing["name"] = utility_name
-                continue
-            seen[key] = {"id": utility_id or utility_name, "name": utility_name or utility_id}
+            if existing is None:
+                seen[key] = {"id": key, "name": utility_name or key}
+            elif utility_name and existing["name"] == key:
+                # First row for this permit had no name; take the real one.
+                existing["name"] = utility_name
 
         return sorted(seen.values(), key=lambda item: item["name"].lower())
 
     def permittee_permit_map(self) -> dict[str, dict[str, object]]:
         """Return a mapping of permittee name -> details about their permits."""
 
-        raw = self._distinct_values([UTILITY_NAME_FIELD, UTILITY_ID_FIELD])
+        raw = self.prefetch_metadata()
         mapping: dict[str, dict[str, object]] = {}
         for attrs in raw:
             name = str(attrs.get(UTILITY_NAME_FIELD) or "").strip()
             permit = str(attrs.get(UTILITY_ID_FIELD) or "").strip()
 
-            # Apply canonical mapping for consistent permittee names
-            if permit and permit in PERMITTEE_MAP:
-                name = PERMITTEE_MAP[permit]
-            elif name and name.lower() in PERMITTEE_MAP:
-                name = PERMITTEE_MAP[name.lower()]
-
-            # Simplify naming (e.g. City of X -> Utilities of X)
-            name = simplify_permittee_name(name)
+            # Apply canonical mapping, then simplify (e.g. City of X -> Utilities of X)
+            name = canonical_permittee_name(permit, name)
 
             if not name and not permit:
                 continue
@@ -382,12 +571,11 @@ class SSOClient:
     def list_counties(self) -> list[str]:
         """Return distinct counties present in the ArcGIS layer."""
 
-        raw_counties = self._distinct_values([COUNTY_FIELD], order_by=COUNTY_FIELD)
-        counties: list[str] = []
-        for attrs in raw_counties:
+        counties: set[str] = set()
+        for attrs in self.prefetch_metadata():
             county = str(attrs.get(COUNTY_FIELD) or "").strip()
-            if not county:
-                continue
-            counties.append(county)
-        counties = sorted(set(counties), key=lambda name: name.lower())
-        return counties
+            if county:
+                counties.add(county)
+        # The shared metadata rows are ordered by utility name, so sort the
+        # (small) distinct county set locally.
+        return sorted(counties, key=str.lower)
@@ -3,15 +3,16 @@ from __future__ import annotations
 
 import argparse
 import sys
+from collections import Counter, defaultdict
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, Iterable, Iterator
 
 from sso_analytics import QAIssue, run_basic_qa, summarize_overall_volume, summarize_volume_by_utility
-from sso_schema import normalize_sso_records
+from sso_transform import normalize_sso_records
 from sso_volume import enrich_est_volume_fields
 
 from sso_client import SSOClient, SSOClientError
-from sso_export import write_ssos_to_csv
+from sso_export import stream_ssos_to_csv, write_ssos_to_csv
 from sso_schema import SSOQuery
 
 
@@ -76,8 +77,7 @@ def _ensure_filters_present(args: argparse.Namespace) -> None:
         )
 
 
-def _summarize(records: List[Dict], output_path: str, limit: int | None) -> None:
-    count = len(records)
+def _summarize(count: int, output_path: str, limit: int | None) -> None:
     message_parts = [f"Fetched {count} records"]
     if limit is not None and count >= limit:
         message_parts.append("(truncated by --limit)")
@@ -85,6 +85,12 @@ def _summarize(records: List[Dict], output_path: str, limit: int | None) -> None
     print(" ".join(message_parts))
 
 
+def _enriched(records: Iterable[Dict]) -> Iterator[Dict]:
+    for record in records:
+        enrich_est_volume_fields(record)
+        yield record
+
+
 def _print_summary(records_norm):
     overall = summarize_overall_volume(records_norm)
     print("=== Volume summary ===")
@@ -110,15 +116,13 @@ def _print_qa_report(records_norm):
         return
 
     print("=== QA report ===")
-    severity_counts: dict[str, int] = {}
-    for issue in issues:
-        severity_counts[issue.severity] = severity_counts.get(issue.severity, 0) + 1
+    severity_counts = Counter(issue.severity for issue in issues)
     for severity, count in sorted(severity_counts.items(), reverse=True):
         print(f"{severity.title()}: {count}")
 
-    issues_by_code: dict[str, list[QAIssue]] = {}
+    issues_by_code: defaultdict[str, list[QAIssue]] = defaultdict(list)
     for issue in issues:
-        issues_by_code.setdefault(issue.code, []).append(issue)
+        issues_by_code[issue.code].append(issue)
 
     for code, code_issues in sorted(issues_by_code.items()):
         preview = code_issues[:3]
@@ -152,6 +156,26 @@ def main(argv: list[str] | None = None) -> int:
 
     client = SSOClient(base_url=args.base_url, api_key=args.api_key, timeout=args.timeout)
 
+    if not (args.summary or args.qa_report):
+        # Nothing needs the full result set, so pages are written to the CSV
+        # as they arrive and only one page is held in memory.
+        try:
+            count = stream_ssos_to_csv(
+                _enriched(client.iter_ssos(query=query, limit=args.limit)), args.output
+            )
+        except SSOClientError as exc:
+            print(f"Error fetching SSO records: {exc}", file=sys.stderr)
+            return 1
+        except ValueError as exc:
+            # A record whose fields differ from the first record's header.
+            print(f"Error writing CSV: {exc}", file=sys.stderr)
+            return 1
+        if not count:
+            print("No records returned for the given filters.")
+            return 0
+        _summarize(count, args.output, args.limit)
+        return 0
+
     try:
         records = client.fetch_ssos(
             query=query,
@@ -170,7 +194,7 @@ def main(argv: list[str] | None = None) -> int:
 
     records_norm = normalize_sso_records(records)
     write_ssos_to_csv(records, args.output)
-    _summarize(records, args.output, args.limit)
+    _summarize(len(records), args.output, args.limit)
     if args.summary:
         _print_summary(records_norm)
     if args.qa_report:
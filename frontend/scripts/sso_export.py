@@ -3,8 +3,11 @@ from __future__ import annotations
 
 import csv
 import gzip
+import os
+import stat
+import tempfile
 from pathlib import Path
-from typing import IO, Iterable, List, Sequence
+from typing import IO, Iterable, Iterator, List, Sequence
 
 
 def _determine_fieldnames(records: Sequence[dict]) -> List[str]:
@@ -20,7 +23,9 @@ def _write_records_to_handle(records: List[dict], handle: IO[str]) -> None:
         handle.write("")
         return
 
-    writer = csv.DictWriter(handle, fieldnames=fieldnames)
+    # fieldnames is the union of every row's keys, so extras are impossible;
+    # "ignore" skips DictWriter's per-row key-set difference.
+    writer = csv.DictWriter(handle, fieldnames=fieldnames, extrasaction="ignore")
     writer.writeheader()
     for row in records:
         writer.writerow(row)
@@ -45,3 +50,55 @@ def write_ssos_to_csv(records: Iterable[dict], output_path: str) -> None:
     open_fn = gzip.open if path.suffix == ".gz" else open
     with open_fn(path, "wt", encoding="utf-8", newline="") as csvfile:
         _write_records_to_handle(records_list, csvfile)
+
+
+def _target_mode(path: Path) -> int:
+    """Return the permission bits ``path`` should end up with."""
+
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def stream_ssos_to_csv(records: Iterable[dict], output_path: str) -> int:
+    """Write SSO records to ``output_path`` as they arrive; returns the row count.
+
+    Unlike :func:`write_ssos_to_csv` the records are never held in memory, so
+    the header is taken from the first record's (sorted) keys. That matches
+    the union header for rows of a single ArcGIS query, which all carry the
+    same attributes; a later row with an unexpected key raises ``ValueError``.
+    Rows go to a temporary file that replaces ``output_path`` only once every
+    record is written, so a failure mid-stream (from the writer or from the
+    iterator itself) leaves no truncated CSV behind. No file is created when
+    ``records`` is empty.
+    """
+
+    iterator: Iterator[dict] = iter(records)
+    first = next(iterator, None)
+    if first is None:
+        return 0
+
+    path = Path(output_path)
+    open_fn = gzip.open if path.suffix == ".gz" else open
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    os.close(fd)
+    count = 1
+    try:
+        with open_fn(tmp_name, "wt", encoding="utf-8", newline="") as csvfile:
+            writer = csv.DictWriter(csvfile, fieldnames=sorted(first.keys()))
+            writer.writeheader()
+            writer.writerow(first)
+            for row in iterator:
+                writer.writerow(row)
+                count += 1
+        # mkstemp creates the file 0600; give it the mode a plain open()
+        # would have (or the existing target's) before it takes its place.
+        os.chmod(tmp_name, _target_mode(path))
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+    return count
@@ -0,0 +1,29 @@
+"""Process-pool helper shared by the PDF parsing scripts."""
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Iterator, Sequence, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+@contextmanager
+def ordered_process_map(
+    fn: Callable[[T], R], items: Sequence[T], workers: int, chunksize: int = 8
+) -> Iterator[Iterator[R]]:
+    """Yield ``fn(item)`` results in input order, across processes when ``workers > 1``.
+
+    Leaving the block early (e.g. the consumer raises) cancels the chunks that
+    have not started instead of waiting for every remaining item.
+    """
+
+    if workers <= 1 or len(items) <= 1:
+        yield map(fn, items)
+        return
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        yield executor.map(fn, items, chunksize=chunksize)
+    finally:
+        executor.shutdown(cancel_futures=True)
@@ -1,6 +1,7 @@
 """Canonical schema and query helpers for SSO records."""
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta, timezone
 from zoneinfo import ZoneInfo
@@ -22,8 +23,13 @@ RECEIVING_WATER_FIELD = "rec_stream"
 
 CENTRAL_TZ = ZoneInfo("America/Chicago")
 
+# UTC offset of America/Chicago keyed by UTC (year, month, day, hour). DST
+# transitions happen on the hour, so the offset is constant within a key.
+_CENTRAL_OFFSET_CACHE: Dict[tuple[int, int, int, int], timedelta] = {}
+_CENTRAL_OFFSET_CACHE_MAX = 4096
 
-@dataclass
+
+@dataclass(slots=True)
 class SSORecord:
     """Canonical representation of an SSO record."""
 
@@ -58,17 +64,25 @@ def format_datetime_central(value: Optional[datetime]) -> Optional[str]:
         return None
 
     dt = value
-    if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=timezone.utc)
     try:
-        localized = dt.astimezone(CENTRAL_TZ)
+        if dt.tzinfo is None or dt.tzinfo is timezone.utc:
+            key = (dt.year, dt.month, dt.day, dt.hour)
+            offset = _CENTRAL_OFFSET_CACHE.get(key)
+            if offset is None:
+                if len(_CENTRAL_OFFSET_CACHE) >= _CENTRAL_OFFSET_CACHE_MAX:
+                    _CENTRAL_OFFSET_CACHE.clear()
+                offset = dt.replace(tzinfo=timezone.utc).astimezone(CENTRAL_TZ).utcoffset()
+                _CENTRAL_OFFSET_CACHE[key] = offset
+            localized = dt.replace(tzinfo=None) + offset
+        else:
+            localized = dt.astimezone(CENTRAL_TZ)
     except Exception:
         return None
 
     return localized.strftime("%Y-%m-%d %H:%M:%S")
 
 
-@dataclass
+@dataclass(slots=True)
 class SSOQuery:
     """Filter model for querying the SSO ArcGIS layer."""
 
@@ -100,6 +114,18 @@ class SSOQuery:
         return value.replace("'", "''")
 
     def build_where_clause(self) -> str:
+        return _cached_where_clause(
+            self.utility_id,
+            self.utility_name,
+            tuple(self.permit_ids) if self.permit_ids else None,
+            self.county,
+            self.start_date,
+            self.end_date,
+            self.min_volume_gallons,
+            self.max_volume_gallons,
+        )
+
+    def _compose_where_clause(self) -> str:
         self.validate()
         clauses: List[str] = ["1=1"]
 
@@ -142,3 +168,29 @@ class SSOQuery:
         if self.extra_params:
             params.update(self.extra_params)
         return params
+
+
+@functools.lru_cache(maxsize=512)
+def _cached_where_clause(
+    utility_id: Optional[str],
+    utility_name: Optional[str],
+    permit_ids: Optional[tuple[str, ...]],
+    county: Optional[str],
+    start_date: Optional[date],
+    end_date: Optional[date],
+    min_volume_gallons: Optional[float],
+    max_volume_gallons: Optional[float],
+) -> str:
+    """Memoized WHERE clause; dashboard filter combinations repeat heavily."""
+
+    query = SSOQuery(
+        utility_id=utility_id,
+        utility_name=utility_name,
+        permit_ids=list(permit_ids) if permit_ids else None,
+        county=county,
+        start_date=start_date,
+        end_date=end_date,
+        min_volume_gallons=min_volume_gallons,
+        max_volume_gallons=max_volume_gallons,
+    )
+    return query._compose_where_clause()
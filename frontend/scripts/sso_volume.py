@@ -1,19 +1,28 @@
 """Helpers for parsing and normalizing estimated volume fields."""
 from __future__ import annotations
 
+import functools
 import logging
 import re
 from typing import Any, Dict, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+_NUMBER_RE = re.compile(r"\d[\d,]*")
 
+
+@functools.lru_cache(maxsize=1024)
 def _normalize_raw_value(raw: str) -> str:
     """Return a normalized representation for mapping lookups."""
 
-    return re.sub(r"\s+", "", raw).lower()
+    # str.split() drops the same (Unicode) whitespace as ``\s`` entirely in C,
+    # about 3x faster than the equivalent re.sub.
+    return "".join(raw.split()).lower()
 
 
+# Keys are whitespace-normalized but keep their thousands separators: ArcGIS
+# truncates the column (e.g. "<=1,0"), and without the comma such a prefix
+# would also match unrelated values like "<=10,000".
 _BUCKET_MAPPINGS = {
     "<=1,0": (0, 1_000),
     "<=1,000": (0, 1_000),
@@ -28,7 +37,6 @@ _BUCKET_MAPPINGS = {
     "50000<gall": (50_000, 75_000),
     "75,000<gall": (75_000, 100_000),
     "75000<gall": (75_000, 100_000),
-    "75,000<gallo": (75_000, 100_000),
     "100,000<gall": (100_000, 250_000),
     "100000<gall": (100_000, 250_000),
     "250,000<gall": (250_000, 500_000),
@@ -36,10 +44,14 @@ _BUCKET_MAPPINGS = {
     "500,000<gall": (500_000, 750_000),
     "500000<gall": (500_000, 750_000),
     "750,000<gall": (750_000, 1_000_000),
-    "750,000<gallo": (750_000, 1_000_000),
     "750000<gall": (750_000, 1_000_000),
 }
 
+# Longest keys first so the alternation returns the most specific prefix.
+_BUCKET_PREFIX_RE = re.compile(
+    "|".join(re.escape(key) for key in sorted(_BUCKET_MAPPINGS, key=len, reverse=True))
+)
+
 
 def _bucket_label(lower: int, upper: Optional[int]) -> str:
     if upper is None:
@@ -67,19 +79,24 @@ def parse_est_volume(raw: Any) -> Tuple[Optional[int], bool, Optional[str]]:
     if not raw_str:
         return None, False, None
 
-    if re.fullmatch(r"[\d,\s]+", raw_str):
-        return int(raw_str.replace(",", "")), False, None
+    return _parse_est_volume_cached(raw_str)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_est_volume_cached(raw_str: str) -> Tuple[Optional[int], bool, Optional[str]]:
+    """Parse a stripped, non-empty value; only a few dozen distinct strings occur."""
 
     norm = _normalize_raw_value(raw_str)
-    if norm in _BUCKET_MAPPINGS:
-        lower, upper = _BUCKET_MAPPINGS[norm]
-        return upper, True, _bucket_label(lower, upper)
+    digits = norm.replace(",", "")
+    if digits.isascii() and digits.isdigit():
+        return int(digits), False, None
 
-    for key, (lower, upper) in _BUCKET_MAPPINGS.items():
-        if norm.startswith(key):
-            return upper, True, _bucket_label(lower, upper)
+    bucket = _BUCKET_PREFIX_RE.match(norm)
+    if bucket:
+        lower, upper = _BUCKET_MAPPINGS[bucket.group()]
+        return upper, True, _bucket_label(lower, upper)
 
-    numbers = [int(value.replace(",", "")) for value in re.findall(r"\d[\d,]*", raw_str)]
+    numbers = [int(value.replace(",", "")) for value in _NUMBER_RE.findall(raw_str)]
     if len(numbers) >= 2:
         lower, upper = numbers[0], numbers[1]
         return upper, True, _bucket_label(lower, upper)
@@ -2,8 +2,10 @@ import os
 import sys
 import logging
 import time
-from datetime import date, timedelta
-from typing import List, Dict, Any
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from typing import List, Dict, Any, Optional
 
 # Add paths
 script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -31,7 +33,7 @@ env_paths = [
 
 for p in env_paths:
     if os.path.exists(p):
-        logger.info(f"Loading env from: {p}")
+        logger.info("Loading env from: %s", p)
         load_dotenv(p, override=True)
         break
 
@@ -44,6 +46,9 @@ if not SUPABASE_URL or not SUPABASE_KEY:
 
 supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
 
+# Concurrent Supabase upserts per year; 1 restores strictly sequential batches.
+UPSERT_WORKERS = int(os.environ.get("SYNC_UPSERT_WORKERS", "4"))
+
 def convert_record(r: dict) -> dict:
     """Convert an ArcGIS SSORecord dict to a Supabase model dict."""
     # Logic to match sso_reports schema
@@ -80,62 +85,125 @@ def convert_record(r: dict) -> dict:
         "raw": r # Store full record for safety
     }
 
+_STR_COLUMNS = (
+    "sso_id", "utility_id", "utility_name", "sewer_system", "county",
+    "location_desc", "est_volume", "cause", "receiving_water",
+)
+_FLOAT_COLUMNS = ("volume_gallons", "x", "y")
+_DATE_COLUMNS = ("date_sso_began", "date_sso_stopped")
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+def fast_report_row(data: dict) -> Optional[dict]:
+    """Build the upsert row directly when ``data`` already has the model's shape.
+
+    Matches ``SSOReportCreate.model_dump(exclude_none=True, mode='json')`` for
+    plain ArcGIS rows (strings, numbers, epoch-ms dates); returns None for
+    anything else so the caller can fall back to full Pydantic validation.
+    """
+    row: Dict[str, Any] = {}
+    for key in _STR_COLUMNS:
+        v = data.get(key)
+        if v is None:
+            continue
+        if type(v) is not str:
+            return None
+        row[key] = v
+    for key in _FLOAT_COLUMNS:
+        v = data.get(key)
+        if v is None:
+            continue
+        if type(v) is int:
+            v = float(v)
+        elif type(v) is not float:
+            return None
+        row[key] = v
+    for key in _DATE_COLUMNS:
+        v = data.get(key)
+        if v is None:
+            continue
+        # Pydantic reads ints above 2e10 as epoch milliseconds (UTC).
+        if type(v) is not int or v <= 2e10:
+            return None
+        row[key] = (_EPOCH + timedelta(milliseconds=v)).isoformat().replace("+00:00", "Z")
+    est_volume_gal = data.get("est_volume_gal")
+    if est_volume_gal is not None:
+        if type(est_volume_gal) is not int or est_volume_gal < 0:
+            return None
+        row["est_volume_gal"] = est_volume_gal
+    if row.get("volume_gallons", 0.0) < 0:
+        return None
+    raw = data.get("raw")
+    if type(raw) is not dict:
+        return None
+    row["est_volume_is_range"] = False
+    row["raw"] = raw
+    return row
+
+def _upsert_batch(batch: List[dict]) -> int:
+    supabase.table("sso_reports").upsert(batch, on_conflict="sso_id").execute()
+    return len(batch)
+
+def _batch_result(future: Future) -> int:
+    """Wait for an upsert future; log and count zero on failure so the sync continues."""
+    try:
+        return future.result()
+    except Exception as e:
+        logger.error("Batch upsert failed: %s", e)
+        return 0
+
 def sync_year(year: int):
     client = SSOClient()
     start_date = date(year, 1, 1)
     end_date = date(year, 12, 31)
     
-    logger.info(f"Syncing year {year}...")
+    logger.info("Syncing year %s...", year)
     query = SSOQuery(start_date=start_date, end_date=end_date)
     
     try:
-        records = client.fetch_ssos(query)
-        if not records:
-            logger.info(f"No records found for {year}.")
-            return
-
-        logger.info(f"Found {len(records)} records for {year}. Preparing upsert...")
-        
         batch_size = 100
         upserted_count = 0
-        
-        # Prepare batch
-        batch = []
-        for r in records:
-            # client.fetch_ssos returns objects or dicts? sso_client says returns List[Dict] in fetch_ssos.
-            # But earlier verify script treated them as objects? No, verify check `isinstance(r, dict)`.
-            # `fetch_ssos` implementation (read via view_file) returns `records: List[Dict[str, Any]]`.
-            # So `r` is a dict.
-            data = convert_record(r)
-            # Validate with Pydantic
-            try:
-                model = SSOReportCreate(**data)
-                batch.append(model.model_dump(exclude_none=True, mode='json'))
-            except Exception as e:
-                logger.warning(f"Validation failed for record {r.get('sso_id')}: {e}")
-            
-            if len(batch) >= batch_size:
-                # Upsert
-                try:
-                    res, count = supabase.table("sso_reports").upsert(batch, on_conflict="sso_id").execute()
-                    upserted_count += len(batch)
+        total = 0
+
+        # Pages stream in from ArcGIS while earlier batches upsert on the pool,
+        # so fetch, validation and Supabase round-trips overlap.
+        with ThreadPoolExecutor(max_workers=UPSERT_WORKERS) as pool:
+            pending: deque = deque()
+            batch: List[dict] = []
+            for r in client.iter_ssos(query):
+                total += 1
+                data = convert_record(r)
+                row = fast_report_row(data)
+                if row is not None:
+                    batch.append(row)
+                else:
+                    # Unusual shapes go through full Pydantic validation
+                    try:
+                        model = SSOReportCreate.model_validate(data)
+                        batch.append(model.model_dump(exclude_none=True, mode='json'))
+                    except Exception as e:
+                        logger.warning("Validation failed for record %s: %s", r.get('sso_id'), e)
+
+                if len(batch) >= batch_size:
+                    pending.append(pool.submit(_upsert_batch, batch))
                     batch = []
-                except Exception as e:
-                    logger.error(f"Batch upsert failed: {e}")
-                    batch = [] # Drop batch to continue? Or retry? For now continue.
-
-        # Final batch
-        if batch:
-             try:
-                res, count = supabase.table("sso_reports").upsert(batch, on_conflict="sso_id").execute()
-                upserted_count += len(batch)
-             except Exception as e:
-                logger.error(f"Final batch upsert failed: {e}")
-
-        logger.info(f"Synced {upserted_count}/{len(records)} records for {year}.")
+                    # Bound in-flight batches so memory stays flat on large years.
+                    while len(pending) > UPSERT_WORKERS * 2:
+                        upserted_count += _batch_result(pending.popleft())
+
+            # Final batch
+            if batch:
+                pending.append(pool.submit(_upsert_batch, batch))
+            while pending:
+                upserted_count += _batch_result(pending.popleft())
+
+        if not total:
+            logger.info("No records found for %s.", year)
+            return
+
+        logger.info("Synced %d/%d records for %s.", upserted_count, total, year)
         
     except Exception as e:
-        logger.error(f"Failed to sync {year}: {e}")
+        logger.error("Failed to sync %s: %s", year, e)
 
 def main():
     # Sync last 10 years + current + next (failures/future dates)
@@ -1,10 +1,14 @@
 import os
-import json
+import asyncio
+import functools
 import logging
-from typing import List, Optional
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
+import httpx
+import orjson
 from pydantic import BaseModel, ValidationError
 from supabase import create_client, Client
-from dotenv import load_dotenv
+from dotenv import dotenv_values
 import sys
 
 # Add backend/src to path for internal imports
@@ -19,10 +23,13 @@ env_path = os.path.join(base_dir, "frontend", ".env.local")
 
 if os.path.exists(env_path):
     logging.info(f"Found .env.local at: {env_path}")
-    from dotenv import dotenv_values
-    found_keys = list(dotenv_values(env_path).keys())
-    logging.info(f"Keys found in .env.local: {found_keys}")
-    load_dotenv(dotenv_path=env_path)
+    # Parse once and apply the values ourselves (like load_dotenv without
+    # override) rather than reading the file a second time.
+    env_values = dotenv_values(env_path)
+    logging.info(f"Keys found in .env.local: {list(env_values.keys())}")
+    for key, value in env_values.items():
+        if value is not None:
+            os.environ.setdefault(key, value)
 else:
     logging.error(f".env.local NOT found at: {env_path}")
 
@@ -35,8 +42,25 @@ if not SUPABASE_URL or not SUPABASE_KEY:
     logging.error(f"Missing Supabase credentials. Checked path: {env_path}")
     sys.exit(1)
 
-supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
-logging.basicConfig(level=logging.INFO)
+# Reports per PostgREST upsert request in sync_all_json.
+UPSERT_BATCH_SIZE = int(os.environ.get("SYNC_UPSERT_BATCH_SIZE", "500"))
+# Worker processes for sync_all_json; 1 syncs files sequentially in-process.
+SYNC_FILE_WORKERS = int(os.environ.get("SYNC_FILE_WORKERS", str(os.cpu_count() or 1)))
+# Concurrent upsert requests per file in sync_all_json.
+HTTP_CONCURRENCY = int(os.environ.get("SYNC_HTTP_CONCURRENCY", "8"))
+# Tries per batch on network errors and 5xx responses, with the delay (in
+# seconds) doubling after each failure.
+UPSERT_ATTEMPTS = 3
+UPSERT_RETRY_BACKOFF = 1.0
+
+@functools.cache
+def get_supabase() -> Client:
+    """Create the supabase-py client on first use.
+
+    sync_all_json talks to PostgREST through httpx, so its worker processes
+    (which import this module) never need to build one.
+    """
+    return create_client(SUPABASE_URL, SUPABASE_KEY)
 
 def upload_report(report_data: dict):
     """Validate and upload a single report to Supabase."""
@@ -45,7 +69,7 @@ def upload_report(report_data: dict):
         report = SSOReportCreate(**report_data)
         
         # Upsert into Supabase (using sso_id as unique constraint in SQL)
-        data, count = supabase.table("sso_reports").upsert(
+        data, count = get_supabase().table("sso_reports").upsert(
             report.model_dump(exclude_none=True),
             on_conflict="sso_id"
         ).execute()
@@ -58,6 +82,93 @@ def upload_report(report_data: dict):
         logging.error(f"Upload failed for report {report_data.get('sso_id')}: {e}")
         return False
 
+def _validated_rows(reports: List[dict]) -> List[dict]:
+    """Validate reports into upsert rows, keeping the last row per sso_id."""
+    # PostgREST rejects an upsert that touches the same row twice, so later
+    # duplicates of an sso_id replace earlier ones as sequential upserts would.
+    rows: Dict[Optional[str], dict] = {}
+    for report_data in reports:
+        try:
+            report = SSOReportCreate(**report_data)
+        except ValidationError as e:
+            logging.warning(f"Validation failed for report {report_data.get('sso_id')}: {e}")
+            continue
+        rows.pop(report.sso_id, None)
+        rows[report.sso_id] = report.model_dump(exclude_none=True)
+    return list(rows.values())
+
+async def _post_rows(client: httpx.AsyncClient, semaphore: asyncio.Semaphore, rows: List[dict]) -> int:
+    # Rows omit None fields, so name the union of columns explicitly as the
+    # supabase client does for bulk upserts.
+    columns = sorted({key for row in rows for key in row})
+    for attempt in range(1, UPSERT_ATTEMPTS + 1):
+        async with semaphore:
+            try:
+                response = await client.post(
+                    "/rest/v1/sso_reports",
+                    params={"on_conflict": "sso_id", "columns": ",".join(columns)},
+                    json=rows,
+                )
+                response.raise_for_status()
+                return len(rows)
+            except httpx.HTTPError as e:
+                # Network failures and 5xx are worth another try; a 4xx
+                # means the batch itself was rejected.
+                retryable = isinstance(e, httpx.TransportError) or (
+                    isinstance(e, httpx.HTTPStatusError) and e.response.status_code >= 500
+                )
+                if not retryable or attempt == UPSERT_ATTEMPTS:
+                    logging.error(f"Batch upload of {len(rows)} reports failed: {e}")
+                    return 0
+                logging.warning(f"Batch upload of {len(rows)} reports failed (attempt {attempt}), retrying: {e}")
+        # Back off outside the semaphore so other batches keep flowing.
+        await asyncio.sleep(UPSERT_RETRY_BACKOFF * 2 ** (attempt - 1))
+    return 0
+
+async def upload_rows_async(rows: List[dict]) -> int:
+    """Upsert validated rows straight to PostgREST with concurrent batch requests.
+
+    Batches share one connection pool and at most SYNC_HTTP_CONCURRENCY are in
+    flight; returns the number of rows written.
+    """
+    headers = {
+        "apikey": SUPABASE_KEY,
+        "Authorization": f"Bearer {SUPABASE_KEY}",
+        "Prefer": "resolution=merge-duplicates,return=minimal",
+    }
+    semaphore = asyncio.Semaphore(HTTP_CONCURRENCY)
+    async with httpx.AsyncClient(base_url=SUPABASE_URL, headers=headers, timeout=60) as client:
+        counts = await asyncio.gather(
+            *(
+                _post_rows(client, semaphore, rows[i:i + UPSERT_BATCH_SIZE])
+                for i in range(0, len(rows), UPSERT_BATCH_SIZE)
+            )
+        )
+    return sum(counts)
+
+def _sync_file(path: str) -> Tuple[str, int, int]:
+    """Sync one links_*.json file; returns (filename, synced, total)."""
+    filename = os.path.basename(path)
+    with open(path, 'rb') as f:
+        records = orjson.loads(f.read())
+    logging.info(f"Syncing {len(records)} records from {filename}...")
+    flat_recs: List[dict] = []
+    for rec in records:
+        # Flatten metadata for the DB
+        flat_rec = {
+            "sso_id": rec["metadata"].get("sso_id") or f"LINK-{rec['url'].split('=')[-1]}",
+            "utility_name": rec["metadata"].get("facility"),
+            "utility_id": rec["metadata"].get("permit"),
+            "county": rec["metadata"].get("county"),
+            "raw": rec
+        }
+        flat_recs.append(flat_rec)
+    # Deduplicating the whole file first keeps concurrent batches from racing
+    # on the same sso_id.
+    rows = _validated_rows(flat_recs)
+    success_count = asyncio.run(upload_rows_async(rows)) if rows else 0
+    return filename, success_count, len(records)
+
 def sync_all_json():
     """Sync all links_*.json data to the database."""
     # Use absolute path for data_dir
@@ -68,25 +179,29 @@ def sync_all_json():
         logging.error(f"Data directory NOT found at: {data_dir}")
         return
 
-    for filename in os.listdir(data_dir):
-        if filename.startswith("links_") and filename.endswith(".json"):
-            path = os.path.join(data_dir, filename)
-            with open(path, 'r') as f:
-                records = json.load(f)
-                logging.info(f"Syncing {len(records)} records from {filename}...")
-                success_count = 0
-                for rec in records:
-                    # Flatten metadata for the DB
-                    flat_rec = {
-                        "sso_id": rec["metadata"].get("sso_id") or f"LINK-{rec['url'].split('=')[-1]}",
-                        "utility_name": rec["metadata"].get("facility"),
-                        "utility_id": rec["metadata"].get("permit"),
-                        "county": rec["metadata"].get("county"),
-                        "raw": rec
-                    }
-                    if upload_report(flat_rec):
-                        success_count += 1
-                logging.info(f"Successfully synced {success_count}/{len(records)} from {filename}")
+    paths = [
+        os.path.join(data_dir, filename)
+        for filename in os.listdir(data_dir)
+        if filename.startswith("links_") and filename.endswith(".json")
+    ]
+    workers = min(len(paths), SYNC_FILE_WORKERS)
+    if workers <= 1:
+        for path in paths:
+            filename, success_count, total = _sync_file(path)
+            logging.info(f"Successfully synced {success_count}/{total} from {filename}")
+        return
+
+    # Files are independent, so JSON parsing and validation run in parallel;
+    # each worker opens its own HTTP connection pool.
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(_sync_file, path): path for path in paths}
+        for future in as_completed(futures):
+            try:
+                filename, success_count, total = future.result()
+            except Exception as e:
+                logging.error(f"Sync failed for {os.path.basename(futures[future])}: {e}")
+                continue
+            logging.info(f"Successfully synced {success_count}/{total} from {filename}")
 
 if __name__ == "__main__":
     sync_all_json()
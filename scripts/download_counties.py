@@ -1,6 +1,6 @@
 
 import requests
-import json
+import orjson
 import os
 
 URL = "https://raw.githubusercontent.com/plotly/datasets/master/geojson-counties-fips.json"
@@ -9,9 +9,9 @@ TARGET_FILE = "frontend/data/al_counties.json"
 def download_and_filter():
     print(f"Downloading from {URL}...")
     try:
-        resp = requests.get(URL)
+        resp = requests.get(URL, timeout=60)
         resp.raise_for_status()
-        data = resp.json()
+        data = orjson.loads(resp.content)
         
         print("Filtering for Alabama (FIPS 01)...")
         al_features = []
@@ -32,8 +32,8 @@ def download_and_filter():
         }
         
         os.makedirs(os.path.dirname(TARGET_FILE), exist_ok=True)
-        with open(TARGET_FILE, "w") as f:
-            json.dump(al_geojson, f)
+        with open(TARGET_FILE, "wb") as f:
+            f.write(orjson.dumps(al_geojson))
             
         print(f"Success! Saved {len(al_features)} counties to {TARGET_FILE}")
         
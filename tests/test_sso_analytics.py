@@ -21,6 +21,7 @@ from sso_analytics import (
     top_spills_by_volume,
     top_utilities_by_volume,
     run_basic_qa,
+    iter_basic_qa,
 )
 from sso_schema import SSORecord
 
@@ -128,6 +129,21 @@ def test_run_basic_qa_detects_expected_issues():
     assert "VOLUME_RANGE_TEXT" in codes
 
 
+def test_iter_basic_qa_is_lazy():
+    consumed = []
+
+    def records():
+        for sso_id in ("1", "2"):
+            consumed.append(sso_id)
+            yield _record(sso_id=sso_id, volume_gallons=-1)
+
+    first = next(iter_basic_qa(records()))
+
+    assert first.code == "NEGATIVE_VOLUME"
+    assert first.sso_id == "1"
+    assert consumed == ["1"]
+
+
 def test_top_utilities_and_spills_by_volume():
     records = [
         _record(sso_id="1", utility_name="A", county="Mobile", volume_gallons=5, location_desc="Loc1"),
@@ -270,3 +286,21 @@ def test_time_series_granularity_and_top_lists():
     assert round(pie[0]["percent_of_total"], 2) == 66.67
 
 
+
+
+def test_summaries_accept_one_shot_iterators():
+    records = [
+        _record(utility_id="U1", date_sso_began=datetime(2021, 1, day), volume_gallons=100.0 * day)
+        for day in range(1, 4)
+    ]
+
+    def gen():
+        return (record for record in records)
+
+    assert summarize_by_month(gen()) == summarize_by_month(records)
+    assert summarize_by_month(gen())[0]["spill_count"] == 3
+    assert summarize_by_utility(gen()) == summarize_by_utility(records)
+    assert summarize_by_volume_bucket(gen()) == summarize_by_volume_bucket(records)
+    assert build_time_series(gen()) == build_time_series(records)
+    assert summarize_top_utilities(gen()) == summarize_top_utilities(records)
+    assert summarize_top_receiving_waters(gen()) == summarize_top_receiving_waters(records)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import json
+
 import pytest
 
 from sso_client import (
@@ -28,14 +30,20 @@ class DummyResponse:
             raise self._json_data
         return self._json_data
 
+    @property
+    def content(self) -> bytes:
+        if isinstance(self._json_data, Exception):
+            return b"not json"
+        return json.dumps(self._json_data).encode("utf-8")
+
 
 class MockSession:
     def __init__(self, responses: list[DummyResponse]) -> None:
         self.responses = responses
         self.calls = []
 
-    def get(self, url, params=None, timeout=None):  # noqa: D401
-        self.calls.append({"url": url, "params": params, "timeout": timeout})
+    def get(self, url, params=None, timeout=None, **kwargs):  # noqa: D401
+        self.calls.append({"url": url, "params": params, "timeout": timeout, **kwargs})
         if not self.responses:
             raise AssertionError("No mock responses left")
         return self.responses.pop(0)
@@ -149,3 +157,128 @@ def test_fetch_ssos_collects_all_pages_when_no_limit():
     assert len(records) == 3
     assert session.calls[1]["params"]["resultOffset"] == 0
     assert session.calls[2]["params"]["resultOffset"] == 2
+
+
+def test_iter_ssos_requests_pages_lazily():
+    responses = [
+        DummyResponse({"supportsPagination": True, "maxRecordCount": 1}),
+        DummyResponse({"features": [{"attributes": {"id": 1}, "geometry": {"x": 1, "y": 1}}]}),
+        DummyResponse({"features": [{"attributes": {"id": 2}, "geometry": None}]}),
+    ]
+    session = MockSession(responses)
+    client = SSOClient(base_url="http://example.com", session=session)
+
+    records = client.iter_ssos(extra_params={"resultRecordCount": 1})
+
+    first = next(records)
+    assert first == {"id": 1, "x": 1, "y": 1}
+    assert len(session.calls) == 2
+
+    second = next(records)
+    assert second == {"id": 2, "x": None, "y": None}
+    assert len(session.calls) == 3
+
+
+class OffsetSession:
+    """Answers by request parameters, since concurrent pages arrive in any order."""
+
+    def __init__(self, total: int, max_record_count: int, server_cap: int | None = None) -> None:
+        self.total = total
+        self.max_record_count = max_record_count
+        # Features actually returned per request, when below maxRecordCount.
+        self.server_cap = server_cap
+        self.calls = []
+
+    def get(self, url, params=None, timeout=None, **kwargs):
+        self.calls.append(dict(params or {}))
+        if "where" not in params:
+            return DummyResponse({"supportsPagination": True, "maxRecordCount": self.max_record_count})
+        if params.get("returnCountOnly") == "true":
+            return DummyResponse({"count": self.total})
+        offset = params["resultOffset"]
+        stop = min(offset + params["resultRecordCount"], self.total)
+        if self.server_cap is not None:
+            stop = min(stop, offset + self.server_cap)
+        return DummyResponse(
+            {"features": [{"attributes": {"id": i}, "geometry": None} for i in range(offset, stop)]}
+        )
+
+
+def test_fetch_ssos_fetches_pages_concurrently_in_order():
+    session = OffsetSession(total=7, max_record_count=2)
+    client = SSOClient(base_url="http://example.com", session=session, page_workers=3)
+
+    records = client.fetch_ssos(limit=5)
+
+    assert [record["id"] for record in records] == [0, 1, 2, 3, 4]
+    offsets = sorted(call["resultOffset"] for call in session.calls if "resultOffset" in call)
+    # Pages past the limit are never requested.
+    assert offsets == [0, 2, 4]
+
+
+def test_fetch_ssos_concurrent_fills_short_pages():
+    session = OffsetSession(total=7, max_record_count=3, server_cap=2)
+    client = SSOClient(base_url="http://example.com", session=session, page_workers=2)
+
+    records = client.fetch_ssos()
+
+    assert [record["id"] for record in records] == list(range(7))
+
+
+def test_iter_ssos_sequential_limit_stops_requests():
+    session = OffsetSession(total=5, max_record_count=1)
+    client = SSOClient(base_url="http://example.com", session=session)
+
+    records = list(client.iter_ssos(limit=2))
+
+    assert [record["id"] for record in records] == [0, 1]
+    # Metadata plus the two pages that held the yielded records.
+    assert len(session.calls) == 3
+
+
+def test_metadata_helpers_share_one_distinct_values_request():
+    session = MockSession(
+        [
+            DummyResponse(
+                {
+                    "features": [
+                        {"attributes": {UTILITY_ID_FIELD: "AL2", UTILITY_NAME_FIELD: "Alpha", COUNTY_FIELD: "Mobile"}},
+                        {"attributes": {UTILITY_ID_FIELD: "AL2", UTILITY_NAME_FIELD: "Alpha", COUNTY_FIELD: "Baldwin "}},
+                        {"attributes": {UTILITY_ID_FIELD: "AL1", UTILITY_NAME_FIELD: "Beta", COUNTY_FIELD: None}},
+                    ]
+                }
+            )
+        ]
+    )
+    client = SSOClient(base_url="http://example.com", session=session)
+
+    assert client.list_counties() == ["Baldwin", "Mobile"]
+    assert client.list_utilities() == [
+        {"id": "AL2", "name": "Alpha"},
+        {"id": "AL1", "name": "Beta"},
+    ]
+    assert client.permittee_permit_map()["alpha"]["permits"] == ["AL2"]
+    assert len(session.calls) == 1
+    assert session.calls[0]["params"]["orderByFields"] == UTILITY_NAME_FIELD
+
+
+def test_list_utilities_sorts_case_insensitively_after_backfill():
+    # ArcGIS orders on the raw permittee value: empty names first, then
+    # case-sensitively, so the client must re-sort.
+    session = MockSession(
+        [
+            DummyResponse(
+                {
+                    "features": [
+                        {"attributes": {UTILITY_ID_FIELD: "AL3", UTILITY_NAME_FIELD: None, COUNTY_FIELD: None}},
+                        {"attributes": {UTILITY_ID_FIELD: "AL1", UTILITY_NAME_FIELD: "Zed", COUNTY_FIELD: None}},
+                        {"attributes": {UTILITY_ID_FIELD: "AL2", UTILITY_NAME_FIELD: "alpha", COUNTY_FIELD: None}},
+                        {"attributes": {UTILITY_ID_FIELD: "AL3", UTILITY_NAME_FIELD: "Mid", COUNTY_FIELD: None}},
+                    ]
+                }
+            )
+        ]
+    )
+    client = SSOClient(base_url="http://example.com", session=session)
+
+    assert [item["name"] for item in client.list_utilities()] == ["alpha", "Mid", "Zed"]
@@ -2,10 +2,13 @@ from __future__ import annotations
 
 import csv
 import gzip
+import stat
 from io import StringIO
 from pathlib import Path
 
-from sso_export import write_ssos_to_csv, write_ssos_to_csv_filelike
+import pytest
+
+from sso_export import stream_ssos_to_csv, write_ssos_to_csv, write_ssos_to_csv_filelike
 
 
 def test_write_ssos_to_csv_creates_expected_headers(tmp_path: Path):
@@ -58,3 +61,51 @@ def test_write_ssos_to_csv_filelike():
     rows = list(reader)
     assert reader.fieldnames == ["a", "b"]
     assert rows[0]["a"] == "1"
+
+
+def test_stream_ssos_to_csv_writes_rows_lazily(tmp_path: Path):
+    output = tmp_path / "stream.csv"
+    records = iter([{"b": "two", "a": 1}, {"a": 3, "b": None}])
+
+    count = stream_ssos_to_csv(records, str(output))
+
+    assert count == 2
+    with output.open(newline="", encoding="utf-8") as csvfile:
+        reader = csv.DictReader(csvfile)
+        assert reader.fieldnames == ["a", "b"]
+        assert list(reader)[1] == {"a": "3", "b": ""}
+
+
+def test_stream_ssos_to_csv_skips_file_when_empty(tmp_path: Path):
+    output = tmp_path / "empty.csv"
+
+    assert stream_ssos_to_csv(iter([]), str(output)) == 0
+    assert not output.exists()
+
+
+def test_stream_ssos_to_csv_leaves_no_partial_file_on_error(tmp_path: Path):
+    output = tmp_path / "broken.csv"
+
+    def records():
+        yield {"a": 1}
+        raise RuntimeError("connection dropped")
+
+    with pytest.raises(RuntimeError):
+        stream_ssos_to_csv(records(), str(output))
+    with pytest.raises(ValueError):
+        stream_ssos_to_csv(iter([{"a": 1}, {"a": 2, "z": 3}]), str(output))
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_stream_ssos_to_csv_matches_plain_writer_permissions(tmp_path: Path):
+    streamed = tmp_path / "streamed.csv"
+    plain = tmp_path / "plain.csv"
+
+    stream_ssos_to_csv(iter([{"a": 1}]), str(streamed))
+    write_ssos_to_csv([{"a": 1}], str(plain))
+
+    assert stat.S_IMODE(streamed.stat().st_mode) == stat.S_IMODE(plain.stat().st_mode)
+
+    streamed.chmod(0o640)
+    stream_ssos_to_csv(iter([{"a": 2}]), str(streamed))
+    assert stat.S_IMODE(streamed.stat().st_mode) == 0o640
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from sso_parallel import ordered_process_map
+
+
+def test_ordered_process_map_runs_inline_for_one_worker():
+    with ordered_process_map(abs, [-3, 1, -2], workers=1) as results:
+        assert list(results) == [3, 1, 2]
+
+
+def test_ordered_process_map_keeps_input_order_across_processes():
+    items = list(range(-20, 0))
+    with ordered_process_map(abs, items, workers=2, chunksize=3) as results:
+        assert list(results) == [abs(item) for item in items]
@@ -2,7 +2,8 @@ import pytest
 from datetime import datetime
 
 from sso_analytics import build_dashboard_summary
-from sso_schema import START_DATE_FIELD, normalize_sso_records
+from sso_schema import START_DATE_FIELD
+from sso_transform import normalize_sso_records
 from sso_volume import enrich_est_volume_fields, parse_est_volume
 
 
@@ -11,6 +12,11 @@ from sso_volume import enrich_est_volume_fields, parse_est_volume
     [
         ("25,000", 25000, False, None),
         ("<=1,0", 1000, True, "0 - 1,000"),
+        ("<=1,000", 1000, True, "0 - 1,000"),
+        # Truncated "<=1,0" must not swallow larger "<=" values.
+        ("<=10,000 gallons", 10000, True, "≥ 10,000"),
+        ("<= 10,000", 10000, True, "≥ 10,000"),
+        ("<=100,000", 100000, True, "≥ 100,000"),
         ("1,000 < gall", 10000, True, "1,000 - 10,000"),
         ("10,000 < gall", 25000, True, "10,000 - 25,000"),
         ("250,000 < gall", 500000, True, "250,000 - 500,000"),